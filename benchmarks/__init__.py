@@ -0,0 +1 @@
+"""Offline benchmarks for the We-Wash integration."""
@@ -0,0 +1,96 @@
+"""Benchmark decoding the We-Wash responses of one refresh cycle.
+
+Compares the standard library decoder with orjson on the payloads the
+mock backend serves, and measures parsing them into the typed models.
+
+Example:
+    python -m benchmarks.bench_decode --rooms 50 --washers 4 --dryers 2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from custom_components.wewash.api import orjson, stdlib_json_loads
+from custom_components.wewash.models import parse_section
+
+from .bench_refresh import percentile
+from .mock_backend import MockConfig, MockWeWashBackend
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rooms", type=int, default=1)
+    parser.add_argument("--washers", type=int, default=1, help="washers per room")
+    parser.add_argument("--dryers", type=int, default=1, help="dryers per room")
+    parser.add_argument("--reservation-ratio", type=float, default=1.0)
+    parser.add_argument("--cycles", type=int, default=200)
+    return parser.parse_args()
+
+
+def payloads(backend: MockWeWashBackend) -> dict[str, bytes]:
+    """Return the response bodies of one refresh cycle."""
+    return {
+        "user": json.dumps({"id": 1, "email": "user@example.com"}).encode(),
+        "laundry_rooms": json.dumps({"selectedLaundryRooms": backend.rooms}).encode(),
+        "reservations": json.dumps({"items": backend.reservations}).encode(),
+        "invoices": json.dumps(
+            {"amount": 12.0, "currency": "EUR", "washingCycles": 5, "dryingCycles": 3}
+        ).encode(),
+    }
+
+
+def time_cycles(
+    bodies: dict[str, bytes], cycles: int, step: Callable[[str, bytes], Any]
+) -> list[float]:
+    """Return the duration of step over all bodies, per cycle."""
+    durations = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        for key, body in bodies.items():
+            step(key, body)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    """Print the p50 and p99 of a measurement."""
+    print(
+        f"{label:<24}p50 {percentile(durations, 0.5) * 1000:8.3f} ms"
+        f"   p99 {percentile(durations, 0.99) * 1000:8.3f} ms"
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a report."""
+    backend = MockWeWashBackend(
+        MockConfig(
+            rooms=args.rooms,
+            washers_per_room=args.washers,
+            dryers_per_room=args.dryers,
+            reservation_ratio=args.reservation_ratio,
+        )
+    )
+    bodies = payloads(backend)
+    print(f"payload per cycle       {sum(map(len, bodies.values())) / 1024:.1f} KiB")
+
+    decoders = {"json": stdlib_json_loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    else:
+        print("orjson is not installed, only the standard library is measured")
+
+    for name, loads in decoders.items():
+        report(f"decode {name}", time_cycles(bodies, args.cycles, lambda _, b: loads(b)))
+    decoded = {key: stdlib_json_loads(body) for key, body in bodies.items()}
+    report(
+        "parse models",
+        time_cycles(decoded, args.cycles, parse_section),  # type: ignore[arg-type]
+    )
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -0,0 +1,112 @@
+"""Benchmark coordinator refreshes against the mock backend.
+
+Example:
+    python -m benchmarks.bench_refresh --rooms 50 --washers 4 --dryers 2 \
+        --latency 0.15 --cycles 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from .harness import async_setup_harness
+from .mock_backend import MockConfig, MockWeWashBackend
+
+
+def percentile(values: list[float], share: float) -> float:
+    """Return the given percentile of the values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rooms", type=int, default=1)
+    parser.add_argument("--washers", type=int, default=1, help="washers per room")
+    parser.add_argument("--dryers", type=int, default=1, help="dryers per room")
+    parser.add_argument("--reservation-ratio", type=float, default=1.0)
+    parser.add_argument("--churn", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=float, default=3600.0, help="seconds")
+    parser.add_argument(
+        "--expire-every", type=int, default=0, help="revoke tokens every N cycles"
+    )
+    parser.add_argument("--cycles", type=int, default=100)
+    parser.add_argument(
+        "--alloc-cycles", type=int, default=10, help="cycles traced for allocations"
+    )
+    return parser.parse_args()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark and print a report."""
+    backend = MockWeWashBackend(
+        MockConfig(
+            rooms=args.rooms,
+            washers_per_room=args.washers,
+            dryers_per_room=args.dryers,
+            reservation_ratio=args.reservation_ratio,
+            churn=args.churn,
+            latency=args.latency,
+            latency_jitter=args.jitter,
+            error_rate=args.error_rate,
+            token_ttl=args.token_ttl,
+        )
+    )
+    base_url = await backend.async_start()
+    harness = await async_setup_harness(base_url)
+    coordinator = harness.coordinator
+
+    durations: list[float] = []
+    requests: list[int] = []
+    writes: list[int] = []
+    failures = 0
+
+    async def run_cycle(cycle: int) -> None:
+        nonlocal failures
+        backend.mutate()
+        if args.expire_every and cycle % args.expire_every == 0:
+            backend.expire_tokens()
+        backend.reset_counters()
+        harness.state_writes.clear()
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        await harness.hass.async_block_till_done()
+        durations.append(time.perf_counter() - start)
+        requests.append(sum(backend.requests.values()))
+        writes.append(len(harness.state_writes))
+        failures += not coordinator.last_update_success
+
+    for cycle in range(1, args.cycles + 1):
+        await run_cycle(cycle)
+
+    tracemalloc.start()
+    allocated: list[int] = []
+    for cycle in range(1, args.alloc_cycles + 1):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        await run_cycle(args.cycles + cycle)
+        allocated.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    await harness.async_stop()
+    await backend.async_stop()
+
+    timed = durations[: args.cycles]
+    print(f"entities               {harness.entity_count}")
+    print(f"cycles                 {args.cycles} ({failures} failed)")
+    print(f"refresh p50            {percentile(timed, 0.50) * 1000:.2f} ms")
+    print(f"refresh p99            {percentile(timed, 0.99) * 1000:.2f} ms")
+    print(f"requests per cycle     {sum(requests) / len(requests):.2f}")
+    print(f"state writes per cycle {sum(writes) / len(writes):.2f}")
+    if allocated:
+        print(f"peak alloc per cycle   {sum(allocated) / len(allocated) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main(parse_args()))
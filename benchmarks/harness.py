@@ -0,0 +1,128 @@
+"""Run the We-Wash coordinator and sensors inside a bare Home Assistant."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import tempfile
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.wewash import sensor
+from custom_components.wewash.api import WeWashApiClient, async_create_session
+from custom_components.wewash.auth import WeWashAuth
+from custom_components.wewash.const import DOMAIN
+from custom_components.wewash.coordinator import WeWashDataUpdateCoordinator
+from custom_components.wewash.stats import WeWashStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class WeWashHarness:
+    """A running integration instance."""
+
+    hass: HomeAssistant
+    coordinator: WeWashDataUpdateCoordinator
+    platform: EntityPlatform
+    state_writes: list[Event] = field(default_factory=list)
+
+    @property
+    def entity_count(self) -> int:
+        """Return the number of sensor entities."""
+        return len(self.platform.entities)
+
+    async def async_stop(self) -> None:
+        """Shut everything down."""
+        await self.coordinator.api.session.close()
+        await self.hass.async_stop(force=True)
+
+
+async def async_create_hass() -> HomeAssistant:
+    """Create a Home Assistant instance with a temporary config dir."""
+    config_dir = tempfile.mkdtemp(prefix="wewash-bench-")
+    try:
+        hass = HomeAssistant(config_dir)  # type: ignore[call-arg]
+    except TypeError:
+        # Older cores take no arguments
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    # Entities register their source on add, like in a full setup
+    entity.async_setup(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    return hass
+
+
+async def async_setup_harness(
+    base_url: str,
+    username: str = "bench@example.com",
+    password: str = "bench",
+    hass: HomeAssistant | None = None,
+    **entry_kwargs: Any,
+) -> WeWashHarness:
+    """Set up the coordinator and sensors against a backend."""
+    hass = hass or await async_create_hass()
+    entry = ConfigEntry(
+        version=1,
+        domain=DOMAIN,
+        title=username,
+        data={CONF_USERNAME: username, CONF_PASSWORD: password},
+        source="user",
+        **entry_kwargs,
+    )
+    session = async_create_session(hass)
+    stats = WeWashStats()
+    auth = WeWashAuth(session, username, password, base_url=base_url, stats=stats)
+    api = WeWashApiClient(session, auth, base_url=base_url, stats=stats)
+    coordinator = WeWashDataUpdateCoordinator(hass, entry, api)
+    await coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=_LOGGER,
+        domain="sensor",
+        platform_name=DOMAIN,
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    harness = WeWashHarness(hass, coordinator, platform)
+
+    @callback
+    def _async_count_state_write(event: Event) -> None:
+        harness.state_writes.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _async_count_state_write)
+
+    requested: list[Entity] = []
+
+    @callback
+    def _async_add_entities(
+        new_entities: Iterable[Entity], update_before_add: bool = False
+    ) -> None:
+        new_entities = list(new_entities)
+        requested.extend(new_entities)
+        # pylint: disable-next=protected-access
+        platform._async_schedule_add_entities(new_entities, update_before_add)
+
+    await sensor.async_setup_entry(hass, entry, _async_add_entities)
+    await hass.async_block_till_done()
+    # Failures to add entities are only logged; the figures would be zeros.
+    # Entities disabled by default are registered but never added.
+    expected = sum(1 for item in requested if item.entity_registry_enabled_default)
+    if not expected or harness.entity_count != expected:
+        await harness.async_stop()
+        raise RuntimeError(
+            f"Only {harness.entity_count} of {expected} sensor entities were "
+            "added, see the log for the errors"
+        )
+    return harness
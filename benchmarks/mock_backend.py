@@ -0,0 +1,311 @@
+"""Local stand-in for the We-Wash backend.
+
+Serves the endpoints used by the integration with generated payloads,
+configurable latency, error rates and token lifetime, and counts every
+request it receives.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import Counter
+from dataclasses import dataclass
+import json
+import random
+import time
+from typing import Any
+import uuid
+
+from aiohttp import web
+
+from custom_components.wewash.const import (
+    AUTH_PATH,
+    AUTH_REFRESH_PATH,
+    LAUNDRY_ROOMS_PATH,
+    RESERVATION_PATH,
+    RESERVATIONS_PATH,
+    UPCOMING_INVOICES_PATH,
+    USER_PATH,
+)
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock backend."""
+
+    rooms: int = 1
+    washers_per_room: int = 1
+    dryers_per_room: int = 1
+    # Share of appliances that carry a reservation of the account
+    reservation_ratio: float = 1.0
+    # Share of reservations that change state between two requests
+    churn: float = 0.1
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    # Lifetime of issued access tokens (seconds)
+    token_ttl: float = 3600.0
+
+
+def make_token(ttl: float) -> str:
+    """Return an unsigned JWT that expires after ttl seconds."""
+
+    def encode(part: dict[str, Any]) -> str:
+        raw = base64.urlsafe_b64encode(json.dumps(part).encode())
+        return raw.rstrip(b"=").decode()
+
+    header = encode({"alg": "none", "typ": "JWT"})
+    payload = encode({"exp": int(time.time() + ttl), "jti": uuid.uuid4().hex})
+    return f"{header}.{payload}.signature"
+
+
+class MockWeWashBackend:
+    """aiohttp application emulating the We-Wash backend."""
+
+    def __init__(self, config: MockConfig | None = None, seed: int = 0) -> None:
+        """Initialize the backend."""
+        self.config = config or MockConfig()
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._tokens: dict[str, float] = {}
+        self._refresh_tokens: set[str] = set()
+        self.rooms = self._generate_rooms()
+        self.reservations = self._generate_reservations()
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_post(AUTH_PATH, self._handle_auth)
+        self.app.router.add_get(AUTH_REFRESH_PATH, self._handle_refresh)
+        self.app.router.add_get(USER_PATH, self._handle_user)
+        self.app.router.add_get(LAUNDRY_ROOMS_PATH, self._handle_rooms)
+        self.app.router.add_get(RESERVATIONS_PATH, self._handle_reservations)
+        self.app.router.add_post(RESERVATIONS_PATH, self._handle_create_reservation)
+        self.app.router.add_delete(
+            RESERVATION_PATH.format(reservation_id="{reservation_id}"),
+            self._handle_cancel_reservation,
+        )
+        self.app.router.add_get(UPCOMING_INVOICES_PATH, self._handle_invoices)
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        sockets = site._server.sockets  # pylint: disable=protected-access
+        self.base_url = f"http://{host}:{sockets[0].getsockname()[1]}"
+        return self.base_url
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def reset_counters(self) -> None:
+        """Forget the requests counted so far."""
+        self.requests.clear()
+        self.bytes_sent = 0
+
+    def expire_tokens(self) -> None:
+        """Invalidate every issued access token."""
+        self._tokens.clear()
+
+    def mutate(self) -> None:
+        """Change the state of a share of the reservations."""
+        for reservation in self.reservations:
+            if self._random.random() < self.config.churn:
+                reservation["status"] = self._random.choice(
+                    ["READY", "ACTIVE", "RESERVATION_TIMED_OUT"]
+                )
+                reservation["statusChangedTimestamp"] = int(time.time() * 1000)
+                reservation["queuePosition"] = self._random.randint(0, 3)
+
+    def _generate_rooms(self) -> list[dict[str, Any]]:
+        """Return the laundry rooms of the account."""
+        cost = {"costOnActive": 1.5, "currencyCode": "EUR"}
+        return [
+            {
+                "id": 1000 + number,
+                "name": f"Laundry Room {number + 1}",
+                "address": {
+                    "street": "Teststraße",
+                    "houseNumber": str(number + 1),
+                    "postalCode": "10115",
+                    "city": "Berlin",
+                },
+                "serviceAvailability": {
+                    "washing": "ENABLED",
+                    "drying": "ENABLED",
+                    "availableWashers": self._random.randint(0, self.config.washers_per_room),
+                    "availableDryers": self._random.randint(0, self.config.dryers_per_room),
+                },
+                "washingCost": cost,
+                "dryingCost": cost,
+                "note": None,
+                "criticalNote": None,
+                "sendingTime": int(time.time() * 1000),
+            }
+            for number in range(self.config.rooms)
+        ]
+
+    def _generate_reservations(self) -> list[dict[str, Any]]:
+        """Return reservations for a share of the appliances."""
+        now_ms = int(time.time() * 1000)
+        reservations = []
+        for room in self.rooms:
+            names = [f"W{n + 1}" for n in range(self.config.washers_per_room)]
+            names += [f"T{n + 1}" for n in range(self.config.dryers_per_room)]
+            for short_name in names:
+                if self._random.random() >= self.config.reservation_ratio:
+                    continue
+                reservations.append(
+                    {
+                        "reservationId": uuid.UUID(int=self._random.getrandbits(128)).hex,
+                        "laundryRoomId": room["id"],
+                        "applianceShortName": short_name,
+                        "serviceType": "DRYING" if short_name.startswith("T") else "WASHING",
+                        "status": "READY",
+                        "applianceOnline": True,
+                        "queuePosition": 0,
+                        "statusChangedTimestamp": now_ms,
+                        "timeoutTimestamp": now_ms + 15 * 60 * 1000,
+                        "currency": "EUR",
+                    }
+                )
+        return reservations
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Count requests and apply latency and errors."""
+        self.requests[request.path] += 1
+        config = self.config
+        if config.latency or config.latency_jitter:
+            delay = self._random.gauss(config.latency, config.latency_jitter)
+            await asyncio.sleep(max(0.0, delay))
+        if config.error_rate and self._random.random() < config.error_rate:
+            return web.json_response({"error": "injected"}, status=503)
+        if request.path not in (AUTH_PATH, AUTH_REFRESH_PATH):
+            token = request.cookies.get("ww_access")
+            if self._tokens.get(token, 0) < time.time():
+                return web.json_response({"error": "unauthorized"}, status=401)
+        response = await handler(request)
+        if isinstance(response, web.Response) and response.body is not None:
+            self.bytes_sent += len(response.body)
+        return response
+
+    def _token_response(self) -> web.Response:
+        """Return a response issuing a new token pair."""
+        access_token = make_token(self.config.token_ttl)
+        refresh_token = uuid.uuid4().hex
+        self._tokens[access_token] = time.time() + self.config.token_ttl
+        self._refresh_tokens.add(refresh_token)
+        response = web.json_response({})
+        response.set_cookie("ww_access", access_token)
+        response.set_cookie("ww_refresh", refresh_token)
+        return response
+
+    async def _handle_auth(self, request: web.Request) -> web.Response:
+        """Log in with any credentials except a wrong password."""
+        body = await request.json()
+        if body.get("password") == "wrong":
+            return web.json_response({"error": "invalid"}, status=401)
+        return self._token_response()
+
+    async def _handle_refresh(self, request: web.Request) -> web.Response:
+        """Exchange a refresh token."""
+        if request.cookies.get("ww_refresh") not in self._refresh_tokens:
+            return web.json_response({"error": "unauthorized"}, status=401)
+        return self._token_response()
+
+    async def _handle_user(self, request: web.Request) -> web.Response:
+        """Return the user profile."""
+        return web.json_response(
+            {"id": 1, "email": "user@example.com", "firstName": "Test", "balance": 12.5}
+        )
+
+    async def _handle_rooms(self, request: web.Request) -> web.Response:
+        """Return the selected laundry rooms."""
+        return web.json_response({"selectedLaundryRooms": self.rooms})
+
+    async def _handle_reservations(self, request: web.Request) -> web.Response:
+        """Return the reservations of the account."""
+        return web.json_response({"items": self.reservations})
+
+    async def _handle_create_reservation(self, request: web.Request) -> web.Response:
+        """Reserve a free appliance of the requested type."""
+        body = await request.json()
+        room = next((r for r in self.rooms if r["id"] == body.get("laundryRoomId")), None)
+        if room is None:
+            return web.json_response({"error": "unknown laundry room"}, status=404)
+        drying = body.get("serviceType") == "DRYING"
+        config = self.config
+        prefix, count = ("T", config.dryers_per_room) if drying else ("W", config.washers_per_room)
+        taken = {
+            r["applianceShortName"] for r in self.reservations if r["laundryRoomId"] == room["id"]
+        }
+        free = [f"{prefix}{n + 1}" for n in range(count) if f"{prefix}{n + 1}" not in taken]
+        if not free:
+            return web.json_response({"error": "no appliance available"}, status=409)
+        now_ms = int(time.time() * 1000)
+        reservation = {
+            "reservationId": uuid.uuid4().hex,
+            "laundryRoomId": room["id"],
+            "applianceShortName": free[0],
+            "serviceType": "DRYING" if drying else "WASHING",
+            "status": "READY",
+            "applianceOnline": True,
+            "queuePosition": 0,
+            "statusChangedTimestamp": now_ms,
+            "timeoutTimestamp": now_ms + 15 * 60 * 1000,
+            "currency": "EUR",
+        }
+        self.reservations.append(reservation)
+        availability = room["serviceAvailability"]
+        key = "availableDryers" if drying else "availableWashers"
+        availability[key] = max(0, availability[key] - 1)
+        return web.json_response(reservation, status=201)
+
+    async def _handle_cancel_reservation(self, request: web.Request) -> web.Response:
+        """Cancel a reservation."""
+        reservation_id = request.match_info["reservation_id"]
+        for reservation in self.reservations:
+            if reservation["reservationId"] == reservation_id:
+                self.reservations.remove(reservation)
+                return web.Response(status=204)
+        return web.json_response({"error": "unknown reservation"}, status=404)
+
+    async def _handle_invoices(self, request: web.Request) -> web.Response:
+        """Return the upcoming invoice."""
+        return web.json_response(
+            {
+                "amount": 12.0,
+                "currency": "EUR",
+                "selectedPaymentMethodThreshold": 20.0,
+                "washingCycles": 5,
+                "dryingCycles": 3,
+                "cumulativeInvoicingDate": int((time.time() + 7 * 86400) * 1000),
+            }
+        )
+
+
+async def _async_main() -> None:
+    """Serve the mock backend until interrupted."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--rooms", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    backend = MockWeWashBackend(MockConfig(rooms=args.rooms, latency=args.latency))
+    print("Serving on", await backend.async_start(port=args.port))
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await backend.async_stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(_async_main())
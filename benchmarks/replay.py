@@ -0,0 +1,142 @@
+"""Replay a captured We-Wash session through the coordinator and sensors.
+
+The captured responses are served by the mock backend, one refresh cycle
+after the other, while the real coordinator and sensor entities consume
+them. Create a capture with the wewash.capture_traffic service.
+
+Example:
+    python -m benchmarks.replay wewash_capture_<entry>_<time>.jsonl.gz --realtime
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+import time
+from typing import Any
+
+from aiohttp import web
+
+from custom_components.wewash.capture import read_capture
+
+from .bench_refresh import percentile
+from .harness import async_setup_harness
+from .mock_backend import MockWeWashBackend
+
+
+class ReplayBackend(MockWeWashBackend):
+    """Mock backend answering with the responses of a capture."""
+
+    def __init__(
+        self,
+        header: dict[str, Any],
+        records: list[dict[str, Any]],
+        realtime: bool = False,
+    ) -> None:
+        """Initialize the backend."""
+        super().__init__()
+        self.realtime = realtime
+        self.cycles: dict[int, dict[str, dict[str, Any]]] = defaultdict(dict)
+        for record in records:
+            self.cycles[record["cycle"]][record["endpoint"]] = record
+        # Latest response per endpoint up to the current cycle, endpoints the
+        # coordinator served from its cache were not captured every cycle.
+        # Start from the sections cached when the capture began.
+        self._current: dict[str, dict[str, Any]] = {
+            endpoint: {"status": 200, "ms": 0.0, "body": body}
+            for endpoint, body in header.get("initial", {}).items()
+        }
+
+    def select_cycle(self, cycle: int) -> None:
+        """Serve the responses captured in a cycle from now on."""
+        self._current.update(self.cycles.get(cycle, {}))
+
+    async def _async_respond(self, endpoint: str) -> web.Response:
+        """Return the captured response of an endpoint."""
+        if (record := self._current.get(endpoint)) is None:
+            return web.json_response({"error": "not captured"}, status=404)
+        if self.realtime:
+            await asyncio.sleep(record["ms"] / 1000)
+        return web.json_response(record["body"] or {}, status=record["status"])
+
+    async def _handle_user(self, request: web.Request) -> web.Response:
+        """Return the captured user profile."""
+        return await self._async_respond("user")
+
+    async def _handle_rooms(self, request: web.Request) -> web.Response:
+        """Return the captured laundry rooms."""
+        return await self._async_respond("laundry_rooms")
+
+    async def _handle_reservations(self, request: web.Request) -> web.Response:
+        """Return the captured reservations."""
+        return await self._async_respond("reservations")
+
+    async def _handle_invoices(self, request: web.Request) -> web.Response:
+        """Return the captured upcoming invoice."""
+        return await self._async_respond("invoices")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("capture", help="capture file (.jsonl.gz)")
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="keep the captured latencies and the pauses between cycles",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="replay the session N times")
+    return parser.parse_args()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Replay the capture and print a report."""
+    header, records = await asyncio.get_running_loop().run_in_executor(
+        None, read_capture, args.capture
+    )
+    cycles = sorted({record["cycle"] for record in records})
+    if not cycles:
+        print("The capture holds no responses")
+        return
+    started = {
+        cycle: min(r["t"] for r in records if r["cycle"] == cycle) for cycle in cycles
+    }
+
+    backend = ReplayBackend(header, records, args.realtime)
+    backend.select_cycle(cycles[0])
+    base_url = await backend.async_start()
+    harness = await async_setup_harness(base_url)
+    coordinator = harness.coordinator
+
+    durations: list[float] = []
+    writes: list[int] = []
+    failures = 0
+    for _ in range(args.repeat):
+        previous = None
+        for cycle in cycles:
+            if args.realtime and previous is not None:
+                await asyncio.sleep(max(0.0, started[cycle] - started[previous]))
+            previous = cycle
+            backend.select_cycle(cycle)
+            # Request what was requested in this cycle, like the capture did
+            coordinator.async_invalidate(*backend.cycles[cycle])
+            harness.state_writes.clear()
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            await harness.hass.async_block_till_done()
+            durations.append(time.perf_counter() - start)
+            writes.append(len(harness.state_writes))
+            failures += not coordinator.last_update_success
+
+    await harness.async_stop()
+    await backend.async_stop()
+
+    print(f"entities               {harness.entity_count}")
+    print(f"cycles                 {len(durations)} ({failures} failed)")
+    print(f"refresh p50            {percentile(durations, 0.50) * 1000:.2f} ms")
+    print(f"refresh p99            {percentile(durations, 0.99) * 1000:.2f} ms")
+    print(f"state writes per cycle {sum(writes) / len(writes):.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main(parse_args()))
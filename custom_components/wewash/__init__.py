@@ -1,34 +1,118 @@
 """The We-Wash integration."""
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .coordinator import WeWashDataUpdateCoordinator
+from .api import WeWashApiClient, async_create_session
+from .auth import WeWashAuth
+from .const import DATA_ROOM_CACHE, DATA_SCHEDULER, DOMAIN, ENDPOINTS, STORAGE_VERSION
+from .coordinator import WeWashDataUpdateCoordinator, cycle_store, snapshot_store
+from .invoice_statistics import WeWashStatisticsImporter
+from .room_cache import RoomCache
+from .scheduler import WeWashRequestScheduler
+from .services import async_setup_services
+from .stats import WeWashStats
 from .config_flow import ConfigFlow  # pylint: disable=unused-import
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+def _token_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the tokens of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.tokens", private=True)
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the We-Wash component."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data[DATA_SCHEDULER] = WeWashRequestScheduler()
+    domain_data[DATA_ROOM_CACHE] = RoomCache()
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up We-Wash from a config entry."""
-    coordinator = WeWashDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    session = async_create_session(hass)
+    stats = WeWashStats()
+    scheduler: WeWashRequestScheduler = hass.data[DOMAIN][DATA_SCHEDULER]
+    auth = WeWashAuth(
+        session,
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        _token_store(hass, entry),
+        stats=stats,
+        scheduler=scheduler,
+    )
+    await auth.async_load()
+    api = WeWashApiClient(session, auth, stats=stats, scheduler=scheduler)
+    scheduler.register(entry.entry_id)
+    entry.async_on_unload(lambda: scheduler.unregister(entry.entry_id))
+
+    async def _async_close_session(_: Event) -> None:
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
+
+    coordinator = WeWashDataUpdateCoordinator(
+        hass, entry, api, hass.data[DOMAIN][DATA_ROOM_CACHE]
+    )
+    await coordinator.async_load_cycles()
+    # Entries set up together take turns instead of draining the shared
+    # request budget at the same moment
+    delay = scheduler.startup_delay(len(ENDPOINTS))
+    # Start from the last known data and refresh in the background, only
+    # wait for the backend when there is nothing to show yet
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        try:
+            await asyncio.sleep(delay)
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await session.close()
+            raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    importer = WeWashStatisticsImporter(hass, entry, coordinator)
+    entry.async_on_unload(
+        coordinator.async_add_listener(importer.async_schedule_import, {"invoices"})
+    )
+    importer.async_schedule_import()
+
+    if restored:
+
+        async def _async_first_refresh() -> None:
+            await asyncio.sleep(delay)
+            await coordinator.async_refresh()
+
+        entry.async_create_background_task(
+            hass, _async_first_refresh(), f"{DOMAIN} {entry.title} refresh"
+        )
+
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: WeWashDataUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_stop_capture()
+        await coordinator.api.session.close()
 
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data of a config entry."""
+    await _token_store(hass, entry).async_remove()
+    await snapshot_store(hass, entry).async_remove()
+    await cycle_store(hass, entry).async_remove()
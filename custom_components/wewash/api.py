@@ -0,0 +1,273 @@
+"""API client for We-Wash."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+import aiohttp
+import async_timeout
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+
+from .const import (
+    API_BASE_URL,
+    CONNECTION_LIMIT,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    MAX_RESPONSE_SIZE,
+    REQUEST_RETRIES,
+    REQUEST_TIMEOUT,
+    RETRY_AFTER_MAX,
+    RETRY_STATUSES,
+)
+from .resilience import backoff_delay, parse_retry_after
+from .scheduler import WeWashRequestScheduler, request_slot
+from .stats import WeWashStats
+
+if TYPE_CHECKING:
+    from .auth import WeWashAuth
+    from .capture import TrafficCapture
+
+_LOGGER = logging.getLogger(__name__)
+
+BASE_HEADERS = {
+    "accept": "application/json",
+    "ww-app-version": "2.68.0",
+    "ww-client": "USERAPP",
+}
+
+JsonLoads = Callable[[bytes], Any]
+
+
+def stdlib_json_loads(body: bytes) -> Any:
+    """Decode a JSON body with the standard library."""
+    return json.loads(body)
+
+
+# orjson ships with Home Assistant; fall back to the standard library
+# when it is missing
+json_loads: JsonLoads = orjson.loads if orjson is not None else stdlib_json_loads
+
+
+class WeWashError(Exception):
+    """Base exception for We-Wash API errors."""
+
+
+class WeWashAuthError(WeWashError):
+    """Raised when the credentials are rejected."""
+
+
+class WeWashTokenExpiredError(WeWashError):
+    """Raised when an endpoint rejects the current access token."""
+
+    def __init__(self, access_token: str | None) -> None:
+        """Initialize the error."""
+        super().__init__("Access token rejected")
+        self.access_token = access_token
+
+
+class WeWashSchemaError(WeWashError):
+    """Raised when a response does not match the expected schema."""
+
+
+class WeWashResponseError(WeWashError):
+    """Raised when a response body is too large or not JSON."""
+
+
+class WeWashApiError(WeWashError):
+    """Raised when an endpoint returns an error status."""
+
+    def __init__(self, status: int, url: str, retry_after: float | None = None) -> None:
+        """Initialize the error."""
+        super().__init__(f"API error {status} from {url}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+@callback
+def async_create_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Create a long-lived, pooled session for one config entry.
+
+    The connector keeps connections alive across polls and caches DNS
+    lookups. Tokens are sent explicitly, so cookies are never stored.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        enable_cleanup_closed=True,
+        ssl=ssl_util.client_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        headers={"user-agent": SERVER_SOFTWARE},
+    )
+
+
+class WeWashApiClient:
+    """Thin client around the We-Wash backend."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        auth: WeWashAuth,
+        base_url: str = API_BASE_URL,
+        stats: WeWashStats | None = None,
+        loads: JsonLoads = json_loads,
+        max_response_size: int = MAX_RESPONSE_SIZE,
+        scheduler: WeWashRequestScheduler | None = None,
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self.scheduler = scheduler
+        self._base_url = base_url
+        self._loads = loads
+        self._max_response_size = max_response_size
+        # Set while the traffic is captured
+        self.capture: TrafficCapture | None = None
+        self.auth = auth
+        self.stats = stats or WeWashStats()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the underlying session."""
+        return self._session
+
+    async def async_get(self, path: str) -> Any:
+        """Fetch a JSON document from an authenticated endpoint.
+
+        Connection errors and 429/5xx responses are retried with jittered
+        exponential backoff, honouring Retry-After. Timeouts are not
+        retried, another slow request would not help a slow backend.
+        """
+        for attempt in range(REQUEST_RETRIES):
+            try:
+                return await self._async_request("GET", path)
+            except WeWashApiError as error:
+                if error.status not in RETRY_STATUSES:
+                    raise
+                delay = error.retry_after
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                elif delay > RETRY_AFTER_MAX:
+                    # Leave long waits to the coordinator's schedule
+                    raise
+            except aiohttp.ClientError:
+                delay = backoff_delay(attempt)
+            self.stats.endpoint(path).retries += 1
+            _LOGGER.debug("Retrying %s in %.1f s", path, delay)
+            await asyncio.sleep(delay)
+        return await self._async_request("GET", path)
+
+    async def async_send(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        stats_key: str | None = None,
+    ) -> Any:
+        """Send a request that changes data and return the decoded response.
+
+        These requests are not idempotent and therefore never retried,
+        except once after a fresh login when the token was rejected.
+        stats_key groups paths containing ids in the statistics.
+        """
+        try:
+            return await self._async_request(method, path, payload, stats_key)
+        except WeWashTokenExpiredError as error:
+            await self.auth.async_authenticate(error.access_token)
+        return await self._async_request(method, path, payload, stats_key)
+
+    async def _async_request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        stats_key: str | None = None,
+    ) -> Any:
+        """Send one request and return the decoded JSON response.
+
+        Empty responses return None.
+        """
+        url = f"{self._base_url}{path}"
+        stats_key = stats_key or path
+        if method != "GET":
+            stats_key = f"{method} {stats_key}"
+        # Captures hold what the coordinator reads, not the actions
+        capture = self.capture if method == "GET" else None
+        access_token = await self.auth.async_get_access_token()
+        headers = {
+            **BASE_HEADERS,
+            "cookie": f"ww_access={access_token}; ww_refresh={self.auth.refresh_token}",
+        }
+        # Waiting for the shared request budget does not count as latency
+        async with request_slot(self.scheduler):
+            start = time.monotonic()
+            try:
+                async with async_timeout.timeout(REQUEST_TIMEOUT):
+                    async with self._session.request(
+                        method, url, headers=headers, json=payload
+                    ) as resp:
+                        body = await self._async_read_body(resp)
+            except asyncio.TimeoutError:
+                self.stats.record_timeout(stats_key)
+                raise
+            except (aiohttp.ClientError, WeWashResponseError):
+                self.stats.record_error(stats_key)
+                raise
+            elapsed = (time.monotonic() - start) * 1000
+        self.stats.record_response(stats_key, resp.status, elapsed, len(body))
+        if capture is not None and resp.status >= 400:
+            capture.record(path, resp.status, elapsed, None)
+
+        if resp.status == 401:
+            raise WeWashTokenExpiredError(access_token)
+        if resp.status >= 400:
+            raise WeWashApiError(
+                resp.status, url, parse_retry_after(resp.headers.get("Retry-After"))
+            )
+        if not body:
+            return None
+        content_type = resp.content_type
+        if content_type != "application/json" and not content_type.endswith("+json"):
+            raise WeWashResponseError(f"Unexpected content type {content_type} from {url}")
+
+        start = time.monotonic()
+        try:
+            data = self._loads(body)
+        except ValueError as error:
+            self.stats.record_error(stats_key)
+            raise WeWashResponseError(f"Malformed JSON from {url}: {error}") from error
+        self.stats.endpoint(stats_key).decode.record((time.monotonic() - start) * 1000)
+        if capture is not None:
+            capture.record(path, resp.status, elapsed, data)
+        return data
+
+    async def _async_read_body(self, resp: aiohttp.ClientResponse) -> bytes:
+        """Read a response body, refusing bodies above the size limit."""
+        limit = self._max_response_size
+        if resp.content_length is not None and resp.content_length > limit:
+            raise WeWashResponseError(
+                f"Response of {resp.content_length} bytes from {resp.url} exceeds {limit}"
+            )
+        # Without a Content-Length the body may be chunked, stop reading
+        # as soon as it grows past the limit
+        body = bytearray()
+        async for chunk in resp.content.iter_any():
+            body += chunk
+            if len(body) > limit:
+                raise WeWashResponseError(
+                    f"Response from {resp.url} exceeds {limit} bytes"
+                )
+        return bytes(body)
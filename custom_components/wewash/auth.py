@@ -0,0 +1,208 @@
+"""Token handling for the We-Wash API."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from typing import Any, Callable
+
+import aiohttp
+import async_timeout
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.storage import Store
+
+from .api import BASE_HEADERS, WeWashApiError, WeWashAuthError
+from .const import (
+    API_BASE_URL,
+    AUTH_PATH,
+    AUTH_REFRESH_PATH,
+    REQUEST_TIMEOUT,
+    TOKEN_REFRESH_MARGIN,
+)
+from .resilience import parse_retry_after
+from .scheduler import WeWashRequestScheduler, request_slot
+from .stats import WeWashStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _token_claims(token: str | None) -> dict[str, Any]:
+    """Return the claims of a JWT access token, empty when unreadable."""
+    if not token:
+        return {}
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, TypeError, ValueError):
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def token_expiry(token: str | None) -> float | None:
+    """Return the expiry (Unix seconds) encoded in a JWT access token."""
+    try:
+        return float(_token_claims(token)["exp"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def token_subject(token: str | None) -> str | None:
+    """Return the account a JWT access token was issued for."""
+    subject = _token_claims(token).get("sub")
+    return str(subject) if subject is not None else None
+
+
+class WeWashAuth:
+    """Keep a valid access token for one We-Wash account.
+
+    Tokens are refreshed shortly before they expire, only one
+    authentication request runs at a time and the tokens survive
+    restarts when a store is given.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        store: Store | None = None,
+        base_url: str = API_BASE_URL,
+        stats: WeWashStats | None = None,
+        scheduler: WeWashRequestScheduler | None = None,
+    ) -> None:
+        """Initialize the token manager."""
+        self._session = session
+        self._scheduler = scheduler
+        self._base_url = base_url
+        self._stats = stats or WeWashStats()
+        self._username = username
+        self._password = password
+        self._store = store
+        self._lock = asyncio.Lock()
+        self.access_token: str | None = None
+        self.refresh_token: str | None = None
+        self.expires_at: float | None = None
+        self.subject: str | None = None
+        self._subject_listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_subject_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call listener whenever a new token belongs to another account."""
+        self._subject_listeners.append(listener)
+        return lambda: self._subject_listeners.remove(listener)
+
+    async def async_load(self) -> None:
+        """Restore the tokens saved by a previous run."""
+        if self._store is None or not (stored := await self._store.async_load()):
+            return
+        self.access_token = stored.get("access_token")
+        self.refresh_token = stored.get("refresh_token")
+        self.expires_at = token_expiry(self.access_token)
+        self.subject = token_subject(self.access_token)
+
+    def _token_valid(self) -> bool:
+        """Return whether the access token can still be used."""
+        if not self.access_token:
+            return False
+        if self.expires_at is None:
+            # Unknown expiry, rely on the backend rejecting it
+            return True
+        return time.time() < self.expires_at - TOKEN_REFRESH_MARGIN
+
+    async def async_get_access_token(self) -> str | None:
+        """Return a valid access token, refreshing it if needed."""
+        if not self._token_valid():
+            await self.async_authenticate(self.access_token)
+        return self.access_token
+
+    async def async_authenticate(self, rejected_token: str | None = None) -> None:
+        """Obtain a fresh access token.
+
+        Callers pass the token they found invalid. Callers that wait for a
+        running authentication return as soon as the token was replaced.
+        """
+        async with self._lock:
+            if self.access_token != rejected_token and self._token_valid():
+                return
+
+            # If we have a refresh token, try to use it first
+            if self.refresh_token:
+                try:
+                    if await self._async_refresh():
+                        return
+                except aiohttp.ClientError:
+                    # If refresh fails, fall back to full authentication
+                    pass
+
+            await self._async_login()
+
+    async def async_login(self) -> None:
+        """Authenticate with username and password."""
+        async with self._lock:
+            await self._async_login()
+
+    async def _async_login(self) -> None:
+        """Authenticate with username and password, lock held."""
+        _LOGGER.debug("Logging in to We-Wash")
+        data = {"username": self._username, "password": self._password}
+        headers = {**BASE_HEADERS, "content-type": "application/json"}
+        # Waiting for the shared request budget does not count as the timeout
+        async with request_slot(self._scheduler), async_timeout.timeout(
+            REQUEST_TIMEOUT
+        ), self._session.post(
+            f"{self._base_url}{AUTH_PATH}", json=data, headers=headers
+        ) as resp:
+            if resp.status in (400, 401, 403):
+                raise WeWashAuthError("Invalid authentication")
+            if resp.status != 200:
+                # Backend trouble, not a credential problem
+                raise WeWashApiError(
+                    resp.status,
+                    str(resp.url),
+                    parse_retry_after(resp.headers.get("Retry-After")),
+                )
+            await self._async_store_tokens(resp)
+        self._stats.logins += 1
+
+    async def _async_refresh(self) -> bool:
+        """Exchange the refresh token for a new access token, lock held."""
+        _LOGGER.debug("Refreshing We-Wash access token")
+        headers = {**BASE_HEADERS, "cookie": f"ww_refresh={self.refresh_token}"}
+        async with request_slot(self._scheduler), async_timeout.timeout(
+            REQUEST_TIMEOUT
+        ), self._session.get(
+            f"{self._base_url}{AUTH_REFRESH_PATH}", headers=headers
+        ) as resp:
+            if resp.status != 200:
+                return False
+            await self._async_store_tokens(resp)
+        self._stats.token_refreshes += 1
+        return True
+
+    async def _async_store_tokens(self, resp: aiohttp.ClientResponse) -> None:
+        """Extract tokens from the response cookies and persist them."""
+        cookies = resp.cookies
+        if "ww_access" in cookies:
+            self.access_token = cookies["ww_access"].value
+        if "ww_refresh" in cookies:
+            self.refresh_token = cookies["ww_refresh"].value
+        self.expires_at = token_expiry(self.access_token)
+        subject = token_subject(self.access_token)
+        if subject != self.subject:
+            self.subject = subject
+            for listener in list(self._subject_listeners):
+                listener()
+
+        if self._store is not None:
+            await self._store.async_save(self._as_dict())
+
+    def _as_dict(self) -> dict[str, Any]:
+        """Return the tokens to persist."""
+        return {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+        }
@@ -0,0 +1,73 @@
+"""Per-endpoint data cache for We-Wash."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Any
+
+
+@dataclass
+class CacheEntry:
+    """Last successfully fetched data of one endpoint."""
+
+    data: Any
+    fetched_at: float
+    # Wall clock time of the fetch, for display
+    updated_at: float
+
+
+class EndpointCache:
+    """Keep endpoint data together with its refresh policy.
+
+    Each section has its own time to live. A TTL of 0 refreshes the
+    section on every update. Invalidated sections are refreshed on the
+    next update regardless of their age.
+    """
+
+    def __init__(self, ttls: dict[str, float]) -> None:
+        """Initialize the cache."""
+        self._ttls = ttls
+        self._entries: dict[str, CacheEntry] = {}
+        self._invalid: set[str] = set()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached data of a section."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        return entry.data
+
+    def set(self, key: str, data: Any) -> None:
+        """Store freshly fetched data of a section."""
+        self._entries[key] = CacheEntry(data, time.monotonic(), time.time())
+        self._invalid.discard(key)
+
+    def invalidate(self, *keys: str) -> None:
+        """Force a refresh of the given sections, or of all sections."""
+        self._invalid.update(keys or self._ttls)
+
+    def age(self, key: str) -> float | None:
+        """Return the age of a section in seconds."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        return time.monotonic() - entry.fetched_at
+
+    def updated_at(self, key: str) -> float | None:
+        """Return the Unix time a section was fetched at."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        return entry.updated_at
+
+    def stale_keys(self) -> list[str]:
+        """Return the sections that need to be fetched."""
+        now = time.monotonic()
+        return [
+            key
+            for key, ttl in self._ttls.items()
+            if key in self._invalid
+            or (entry := self._entries.get(key)) is None
+            or now - entry.fetched_at >= ttl
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all cached sections."""
+        return {key: entry.data for key, entry in self._entries.items()}
@@ -0,0 +1,141 @@
+"""Capture of the We-Wash API traffic for offline replay.
+
+A capture is a gzip compressed JSON lines file. The first line is a
+header, every further line one response:
+
+    {"version": 1, "started": 1718000000.0, "endpoints": {"user": "/v3/..."},
+     "initial": {"user": {...}, "invoices": {...}}}
+    {"cycle": 1, "t": 0.012, "endpoint": "reservations", "status": 200,
+     "ms": 143.2, "body": {...}}
+
+initial holds the sections cached when the capture started. Sections with
+a long TTL, like the user profile, may not be fetched while capturing,
+and replay serves them from there. t is the time since the start of the
+capture in seconds, ms the request latency. Personal fields are redacted; reservation ids are replaced by
+pseudonyms that stay stable within one capture so transitions can still
+be followed.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import secrets
+import threading
+import time
+from typing import Any
+
+from .const import CAPTURE_VERSION, ENDPOINTS, TO_REDACT
+
+REDACTED = "**REDACTED**"
+# Redacted keys whose values are replaced by a pseudonym instead
+PSEUDONYMIZED = {"reservationId"}
+
+_ENDPOINT_BY_PATH = {path: key for key, path in ENDPOINTS.items()}
+
+
+class TrafficCapture:
+    """Collect responses in memory and append them to a capture file."""
+
+    def __init__(self, path: str, initial: dict[str, Any] | None = None) -> None:
+        """Initialize the capture.
+
+        initial maps sections to their cached responses in API shape.
+        """
+        self.path = path
+        self._created = False
+        self._salt = secrets.token_bytes(16)
+        self._start = time.monotonic()
+        self._cycle = 0
+        self._write_lock = threading.Lock()
+        self._pending: list[str] = [
+            json.dumps(
+                {
+                    "version": CAPTURE_VERSION,
+                    "started": time.time(),
+                    "endpoints": ENDPOINTS,
+                    "initial": self._redact(initial or {}),
+                }
+            )
+        ]
+
+    def next_cycle(self) -> None:
+        """Mark the start of a refresh cycle."""
+        self._cycle += 1
+
+    def record(self, path: str, status: int, milliseconds: float, body: Any) -> None:
+        """Record one response."""
+        self._pending.append(
+            json.dumps(
+                {
+                    "cycle": self._cycle,
+                    "t": round(time.monotonic() - self._start, 3),
+                    "endpoint": _ENDPOINT_BY_PATH.get(path, path),
+                    "status": status,
+                    "ms": round(milliseconds, 1),
+                    "body": self._redact(body),
+                },
+                separators=(",", ":"),
+            )
+        )
+
+    def take_pending(self) -> list[str]:
+        """Return and forget the lines not written yet."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def write(self, lines: list[str]) -> None:
+        """Append lines to the capture file (blocking)."""
+        if not lines:
+            return
+        with self._write_lock:
+            if not self._created:
+                self._create()
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.writelines(f"{line}\n" for line in lines)
+
+    def _create(self) -> None:
+        """Create the capture file, never appending to an existing one."""
+        base, suffix = self.path, ""
+        if base.endswith(".jsonl.gz"):
+            base, suffix = base[: -len(".jsonl.gz")], ".jsonl.gz"
+        path, number = self.path, 1
+        while True:
+            try:
+                with gzip.open(path, "xt", encoding="utf-8"):
+                    break
+            except FileExistsError:
+                number += 1
+                path = f"{base}_{number}{suffix}"
+        self.path = path
+        self._created = True
+
+    def _redact(self, value: Any) -> Any:
+        """Return value with personal fields redacted."""
+        if isinstance(value, list):
+            return [self._redact(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        redacted = {}
+        for key, item in value.items():
+            if key in PSEUDONYMIZED and item is not None:
+                redacted[key] = self._pseudonym(item)
+            elif key in TO_REDACT:
+                redacted[key] = REDACTED
+            else:
+                redacted[key] = self._redact(item)
+        return redacted
+
+    def _pseudonym(self, value: Any) -> str:
+        """Return a stable pseudonym of value."""
+        digest = hashlib.sha256(self._salt + str(value).encode())
+        return digest.hexdigest()[:16]
+
+
+def read_capture(path: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Return the header and the responses of a capture file (blocking)."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        if header.get("version") != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version {header.get('version')}")
+        return header, [json.loads(line) for line in file if line.strip()]
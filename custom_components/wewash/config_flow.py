@@ -7,10 +7,13 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, AUTH_URL
+from .api import WeWashApiError, WeWashAuthError, async_create_session
+from .auth import WeWashAuth
+from .const import CONF_STALE_WINDOW, DEFAULT_STALE_WINDOW, DOMAIN, MAX_STALE_WINDOW
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,9 +33,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self._test_credentials(
                     user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
                 )
-            except aiohttp.ClientError:
+            except (aiohttp.ClientError, WeWashApiError):
                 errors["base"] = "cannot_connect"
-            except ValueError:
+            except WeWashAuthError:
                 errors["base"] = "invalid_auth"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
@@ -54,15 +57,48 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def _test_credentials(self, username: str, password: str) -> None:
-        """Validate credentials."""
-        async with aiohttp.ClientSession() as session:
-            data = {"username": username, "password": password}
-            headers = {
-                "accept": "application/json",
-                "content-type": "application/json",
-                "ww-app-version": "2.68.0",
-                "ww-client": "USERAPP",
-            }
-            async with session.post(AUTH_URL, json=data, headers=headers) as resp:
-                if resp.status != 200:
-                    raise ValueError("Invalid authentication")
+        """Validate credentials.
+
+        A session of its own keeps the token cookies out of the shared jar.
+        """
+        session = async_create_session(self.hass)
+        try:
+            await WeWashAuth(session, username, password).async_login()
+        finally:
+            await session.close()
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow."""
+        return OptionsFlowHandler(config_entry)
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the options of a We-Wash entry."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_STALE_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_STALE_WINDOW, DEFAULT_STALE_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_STALE_WINDOW)),
+                }
+            ),
+        )
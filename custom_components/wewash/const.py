@@ -2,21 +2,177 @@
 
 DOMAIN = "wewash"
 
-# API endpoints
-AUTH_URL = "https://backend.we-wash.com/auth"
-USER_URL = "https://backend.we-wash.com/v3/users/me"
-LAUNDRY_ROOMS_URL = "https://backend.we-wash.com/v3/users/me/laundry-rooms"
-RESERVATIONS_URL = "https://backend.we-wash.com/v3/users/me/reservations"
-UPCOMING_INVOICES_URL = "https://backend.we-wash.com/v3/users/me/upcoming-invoices"
-AUTH_REFRESH_URL = "https://backend.we-wash.com/auth/refresh"
-
-# Update interval (30 seconds for more responsive updates)
+# API endpoints, relative to the backend base URL
+API_BASE_URL = "https://backend.we-wash.com"
+AUTH_PATH = "/auth"
+USER_PATH = "/v3/users/me"
+LAUNDRY_ROOMS_PATH = "/v3/users/me/laundry-rooms"
+RESERVATIONS_PATH = "/v3/users/me/reservations"
+UPCOMING_INVOICES_PATH = "/v3/users/me/upcoming-invoices"
+AUTH_REFRESH_PATH = "/auth/refresh"
+# Cancelling (DELETE) a reservation; they are created with POST on RESERVATIONS_PATH
+RESERVATION_PATH = "/v3/users/me/reservations/{reservation_id}"
+
+# Data sections fetched on every update, keyed by the name used in coordinator.data
+ENDPOINTS = {
+    "user": USER_PATH,
+    "laundry_rooms": LAUNDRY_ROOMS_PATH,
+    "reservations": RESERVATIONS_PATH,
+    "invoices": UPCOMING_INVOICES_PATH,
+}
+
+# Sections whose failure keeps the previous data instead of failing the update
+OPTIONAL_ENDPOINTS = ("invoices",)
+
+# How long each section is cached (seconds); 0 refreshes it on every update.
+# The user profile is also refreshed after re-authentication.
+ENDPOINT_TTL = {
+    "user": 86400,
+    "laundry_rooms": 0,
+    "reservations": 0,
+    "invoices": 3600,
+}
+
+# Update interval while a reservation is pending (seconds)
 UPDATE_INTERVAL = 30
 
+# Adaptive update intervals, chosen from the latest data (seconds)
+ACTIVE_UPDATE_INTERVAL = 15  # a reservation is ACTIVE/READY or about to time out
+IDLE_UPDATE_INTERVAL = 300  # no reservations on the account
+MIN_UPDATE_INTERVAL = 5
+TIMEOUT_PROXIMITY = 120  # a timeout this close counts as active
+TIMEOUT_GRACE = 2  # poll this long after a known timeout
+
+# Reservation statuses that warrant fast polling
+ACTIVE_STATUSES = ("ACTIVE", "READY")
+
+# Options: minutes a section that fails to refresh keeps serving its last
+# good data before the entities become unavailable; 0 disables this
+CONF_STALE_WINDOW = "stale_window"
+DEFAULT_STALE_WINDOW = 15
+MAX_STALE_WINDOW = 1440
+
+# Timeout for a single endpoint request (seconds)
+REQUEST_TIMEOUT = 10
+
+# Largest response body accepted from an endpoint (bytes)
+MAX_RESPONSE_SIZE = 4 * 1024 * 1024
+
+# Retries of a single request
+REQUEST_RETRIES = 2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_BACKOFF = 1  # seconds, doubled per attempt
+RETRY_BACKOFF_MAX = 8
+RETRY_AFTER_MAX = 10  # longer Retry-After values fail the request
+
+# Circuit breaker: after this many failed updates in a row the poll
+# interval grows from the base up to the max (seconds)
+CIRCUIT_THRESHOLD = 3
+CIRCUIT_BASE_INTERVAL = 60
+CIRCUIT_MAX_INTERVAL = 1800
+
+# Request budget shared by all config entries: token bucket rate
+# (requests per second) and size, and concurrent requests
+GLOBAL_REQUEST_RATE = 2.0
+GLOBAL_REQUEST_BURST = 10
+GLOBAL_MAX_CONCURRENT = 4
+# A request waiting this long for the budget counts as saturation (seconds),
+# reported at most once per log interval
+SATURATION_WAIT = 5
+SATURATION_LOG_INTERVAL = 600
+# Keys of the shared objects in hass.data[DOMAIN], next to the coordinators
+DATA_SCHEDULER = "scheduler"
+DATA_ROOM_CACHE = "room_cache"
+
+# HTTP connection pool (keep-alive outlives the update interval)
+CONNECTION_LIMIT = 10
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+# Refresh the access token this long before it expires (seconds)
+TOKEN_REFRESH_MARGIN = 60
+
+# Version of the data persisted in .storage
+STORAGE_VERSION = 1
+
+# Coalesce snapshot writes of changed data (seconds)
+SNAPSHOT_SAVE_DELAY = 30
+
+# Cycle history: completed cycle durations kept per appliance, samples
+# needed for a prediction, and the plausible cycle length (seconds)
+CYCLE_HISTORY_SIZE = 20
+CYCLE_MIN_SAMPLES = 3
+CYCLE_MIN_DURATION = 5 * 60
+CYCLE_MAX_DURATION = 6 * 3600
+# A longer gap between two reservation fetches leaves the end of a
+# vanished cycle unknown (seconds)
+CYCLE_OBSERVATION_GAP = 600
+# While a cycle runs, poll this long before its predicted end and at
+# most this far apart (seconds)
+FINISH_LEAD = 60
+PREDICTION_MAX_INTERVAL = 120
+
+# Performance statistics: latency histogram bounds (ms) and samples kept
+# for percentiles
+LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+STATS_SAMPLES = 100
+
+# Services
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+SERVICE_CAPTURE_TRAFFIC = "capture_traffic"
+SERVICE_CREATE_RESERVATION = "create_reservation"
+SERVICE_CANCEL_RESERVATION = "cancel_reservation"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+ATTR_LAUNDRY_ROOM_ID = "laundry_room_id"
+ATTR_APPLIANCE_TYPE = "appliance_type"
+ATTR_APPLIANCE = "appliance"
+
+# Sections refreshed after a reservation was created or cancelled
+RESERVATION_SECTIONS = ("reservations", "laundry_rooms")
+
+# Traffic captures: format version and default length (minutes)
+CAPTURE_VERSION = 1
+CAPTURE_DURATION = 60
+
+# Keys removed from diagnostics and traffic captures
+TO_REDACT = {
+    "password",
+    "username",
+    "email",
+    "firstName",
+    "lastName",
+    "phoneNumber",
+    "street",
+    "houseNumber",
+    "reservationId",
+    "iban",
+    # The config entry title and unique id hold the account username
+    "title",
+    "unique_id",
+}
+
+# Events fired when the reservations change between two updates
+EVENT_RESERVATION_CREATED = "wewash_reservation_created"
+EVENT_RESERVATION_STARTED = "wewash_reservation_started"
+EVENT_RESERVATION_FINISHED = "wewash_reservation_finished"
+EVENT_RESERVATION_TIMED_OUT = "wewash_reservation_timed_out"
+EVENT_RESERVATION_REMOVED = "wewash_reservation_removed"
+EVENT_RESERVATION_STATUS_CHANGED = "wewash_reservation_status_changed"
+EVENT_QUEUE_POSITION_CHANGED = "wewash_queue_position_changed"
+EVENT_APPLIANCE_OFFLINE = "wewash_appliance_offline"
+EVENT_APPLIANCE_ONLINE = "wewash_appliance_online"
+
 # Configuration
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
+# Appliance types
+APPLIANCE_WASHER = "washer"
+APPLIANCE_DRYER = "dryer"
+# Backend service type of each appliance type
+SERVICE_TYPES = {APPLIANCE_WASHER: "WASHING", APPLIANCE_DRYER: "DRYING"}
+
 # Icons
 ICON_WASHER = "mdi:washing-machine"
 ICON_DRYER = "mdi:tumble-dryer"
@@ -28,6 +184,7 @@ ICON_TIMER = "mdi:timer"
 ICON_MACHINE = "mdi:washing-machine"
 ICON_LAUNDRY_ROOM = "mdi:home-assistant"
 ICON_CYCLE_COUNT = "mdi:counter"
+ICON_PERFORMANCE = "mdi:speedometer"
 
 # Default device info
 MANUFACTURER = "We-Wash"
@@ -1,32 +1,110 @@
 """Data update coordinator for We-Wash."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import replace
 from datetime import timedelta
+from typing import Any
+import cProfile
 import logging
+import time
 import asyncio
 import aiohttp
-import async_timeout
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .api import (
+    WeWashApiClient,
+    WeWashAuthError,
+    WeWashError,
+    WeWashSchemaError,
+    WeWashTokenExpiredError,
+)
+from .cache import EndpointCache
+from .capture import TrafficCapture
+from .cycles import CycleHistory
+from .events import reservation_events
+from .index import WeWashIndex
+from .models import (
+    LaundryRooms,
+    Reservation,
+    Reservations,
+    Room,
+    Section,
+    parse_section,
+    parse_sections,
+    sections_as_api,
+)
+from .resilience import CircuitBreaker
+from .room_cache import RoomCache
 from .const import (
     DOMAIN,
     UPDATE_INTERVAL,
-    AUTH_URL,
-    USER_URL,
-    LAUNDRY_ROOMS_URL,
-    RESERVATIONS_URL,
-    UPCOMING_INVOICES_URL,
-    AUTH_REFRESH_URL,
+    ACTIVE_UPDATE_INTERVAL,
+    IDLE_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    TIMEOUT_PROXIMITY,
+    TIMEOUT_GRACE,
+    ACTIVE_STATUSES,
+    CONF_STALE_WINDOW,
+    FINISH_LEAD,
+    PREDICTION_MAX_INTERVAL,
+    DEFAULT_STALE_WINDOW,
+    ENDPOINTS,
+    ENDPOINT_TTL,
+    OPTIONAL_ENDPOINTS,
+    RESERVATION_PATH,
+    RESERVATION_SECTIONS,
+    RESERVATIONS_PATH,
+    SERVICE_TYPES,
+    APPLIANCE_WASHER,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+
+def snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the last known data of a config entry."""
+    return Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot", private=True
+    )
+
+
+def cycle_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the cycle history of a config entry."""
+    return Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.cycles", private=True
+    )
+
+
+def _reservations(data: dict[str, Section]) -> tuple[Reservation, ...]:
+    """Return all reservations in the data."""
+    reservations: Reservations | None = data.get("reservations")
+    return reservations.items if reservations else ()
+
+
+def _reservation_ids(data: dict[str, Section]) -> set[Any]:
+    """Return the ids of all reservations in the data."""
+    return {reservation.reservation_id for reservation in _reservations(data)}
+
+
 class WeWashDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching We-Wash data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: WeWashApiClient,
+        room_cache: RoomCache | None = None,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -34,135 +112,569 @@ class WeWashDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
-        self.access_token = None
-        self.refresh_token = None
+        self.api = api
         self.entry = entry
+        self.room_cache = room_cache
+        self._cache = EndpointCache(ENDPOINT_TTL)
+        # Also a proactive token refresh may switch the account
+        api.auth.async_add_subject_listener(lambda: self._cache.invalidate("user"))
+        self.circuit = CircuitBreaker()
+        self._index = WeWashIndex()
+        self._index_source: dict[str, Any] | None = None
+        self._previous_sections: dict[str, Section] = {}
+        self._notified_state: tuple[Any, ...] = (True, False, frozenset())
+        self.changed_sections: set[str] = set()
+        # Sections whose last refresh failed and that serve cached data
+        self.stale_sections: set[str] = set()
+        # Sections whose fetch failed in the last update, and since when
+        # (monotonic) each section has been failing
+        self._failed_sections: set[str] = set()
+        self._failing_since: dict[str, float] = {}
+        self._notified_index = WeWashIndex()
+        # Reservations of the last live update, the base of the events
+        self._event_base: tuple[WeWashIndex, tuple[Reservation, ...]] | None = None
+        # Data before the optimistic result of an action, until it is confirmed
+        self._confirmed_data: dict[str, Any] | None = None
+        self._optimistic = False
+        self._snapshot_outdated = False
+        self._snapshot_store = snapshot_store(hass, entry)
+        self.cycles = CycleHistory()
+        self._cycle_store = cycle_store(hass, entry)
+        # True while the data comes from the snapshot of a previous run
+        self.restored = False
+        self.data_updated_at: float | None = None
+        self._unsub_capture: CALLBACK_TYPE | None = None
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last data saved by a previous run.
+
+        Returns whether a snapshot was restored.
+        """
+        if not (snapshot := await self._snapshot_store.async_load()):
+            return False
+        try:
+            self.data = self._intern(parse_sections(snapshot["data"]))
+        except WeWashSchemaError as error:
+            _LOGGER.warning("Ignoring invalid We-Wash snapshot: %s", error)
+            return False
+        self.data_updated_at = snapshot.get("updated_at")
+        self.restored = True
+        _LOGGER.debug("Restored We-Wash data from %s", self.data_updated_at)
+        return True
+
+    async def async_load_cycles(self) -> None:
+        """Load the cycle history of a previous run."""
+        if not (stored := await self._cycle_store.async_load()):
+            return
+        try:
+            self.cycles = CycleHistory.from_dict(stored)
+        except (KeyError, TypeError) as error:
+            _LOGGER.warning("Ignoring invalid We-Wash cycle history: %s", error)
+
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the snapshot to save, never an unconfirmed result."""
+        data = self._confirmed_data if self._confirmed_data is not None else self.data
+        return {"data": sections_as_api(data), "updated_at": self.data_updated_at}
+
+    @property
+    def index(self) -> WeWashIndex:
+        """Return the lookup index of the current data.
+
+        The index is rebuilt once whenever the data is replaced.
+        """
+        if self._index_source is not self.data:
+            self._index = WeWashIndex.from_data(self.data or {})
+            self._index_source = self.data
+        return self._index
+
+    @property
+    def stale_window(self) -> timedelta:
+        """Return how long a failing section keeps serving its last data."""
+        return timedelta(
+            minutes=self.entry.options.get(CONF_STALE_WINDOW, DEFAULT_STALE_WINDOW)
+        )
+
+    def data_age(self) -> dict[str, float | None]:
+        """Return the age of every data section in seconds."""
+        return {key: self._cache.age(key) for key in ENDPOINTS}
+
+    def stale_since(self, sections: Iterable[str]) -> float | None:
+        """Return when the oldest of the given stale sections was fetched.
+
+        None when none of them is stale.
+        """
+        times = [
+            updated_at
+            for key in self.stale_sections.intersection(sections)
+            if (updated_at := self._cache.updated_at(key)) is not None
+        ]
+        return min(times, default=None)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data changed.
+
+        Listeners register what they render as their context: data
+        sections, or the channel of a single room or appliance (see
+        index.room_channel and index.appliance_channel). Listeners
+        without a context, and all listeners when availability, the
+        restored flag or the stale sections change, are always notified.
+        Optimistic data only reaches the entities: events and the snapshot
+        wait for the refresh that confirms it.
+        """
+        self.changed_sections = self._diff_sections()
+        changed: set[Any] = set(self.changed_sections)
+        if self.changed_sections & {"laundry_rooms", "reservations"}:
+            index = self.index
+            changed |= index.changed_channels(self._notified_index)
+            self._notified_index = index
+        state = (self.last_update_success, self.restored, frozenset(self.stale_sections))
+        notify_all = state != self._notified_state
+        self._notified_state = state
+
+        if self._optimistic:
+            # The confirmed data may not differ from what the entities show
+            self._snapshot_outdated = True
+        else:
+            self._confirmed_data = None
+            if self.last_update_success and not self.restored:
+                if self.changed_sections or self._snapshot_outdated:
+                    self._snapshot_store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+                    self._snapshot_outdated = False
+                self._async_fire_reservation_events()
+
+        for update_callback, context in list(self._listeners.values()):
+            if notify_all or not context or not changed.isdisjoint(context):
+                update_callback()
+
+    @callback
+    def _async_fire_reservation_events(self) -> None:
+        """Fire an event for every reservation transition since the last update.
+
+        Data restored from a snapshot is not a base for events, it may be
+        arbitrarily old.
+        """
+        reservations = _reservations(self.data or {})
+        # Compared to the base, not the last notification: that may have
+        # been an optimistic one
+        if self._event_base is not None and reservations == self._event_base[1]:
+            return
+        current = (self.index, reservations)
+        if self._event_base is not None:
+            for event_type, event_data in reservation_events(*self._event_base, *current):
+                event_data["config_entry_id"] = self.entry.entry_id
+                self.hass.bus.async_fire(event_type, event_data)
+        self._event_base = current
+
+    @callback
+    def _async_observe_cycles(self, data: dict[str, Any]) -> None:
+        """Feed newly fetched reservations to the cycle history.
+
+        Runs before data is published, so the index is built here and
+        kept for when data becomes the coordinator data.
+        """
+        if (fetched_at := self._cache.updated_at("reservations")) is None:
+            return
+        if self._index_source is not data:
+            self._index = WeWashIndex.from_data(data)
+            self._index_source = data
+        if self.cycles.observe(self._index, fetched_at * 1000):
+            self._cycle_store.async_delay_save(self.cycles.as_dict, SNAPSHOT_SAVE_DELAY)
+
+    def _diff_sections(self) -> set[str]:
+        """Return the data sections that changed since the last call."""
+        data = self.data or {}
+        # Parsed sections compare by value; cached ones are the same object
+        changed = {
+            key
+            for key in data.keys() | self._previous_sections.keys()
+            if self._previous_sections.get(key) != data.get(key)
+        }
+        self._previous_sections = dict(data)
+        return changed
+
+    async def async_profile_refresh(self, path: str) -> None:
+        """Profile one refresh cycle including entity state rendering.
+
+        The cProfile statistics are written to path.
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.async_refresh()
+            # Render every entity, not only the ones whose data changed
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+        finally:
+            profiler.disable()
+        await self.hass.async_add_executor_job(profiler.dump_stats, path)
+        _LOGGER.info("Saved We-Wash refresh profile to %s", path)
+
+    @callback
+    def async_start_capture(self, path: str, duration: timedelta) -> None:
+        """Capture the API traffic to path for the given duration."""
+        self.async_stop_capture()
+        # Long lived sections may not be fetched while capturing
+        self.api.capture = TrafficCapture(path, sections_as_api(self._cache.as_dict()))
+        self._unsub_capture = async_call_later(
+            self.hass, duration, lambda _: self.async_stop_capture()
+        )
+        _LOGGER.info("Capturing We-Wash traffic to %s for %s", path, duration)
+
+    @callback
+    def async_stop_capture(self) -> None:
+        """Stop capturing the API traffic."""
+        if self._unsub_capture is not None:
+            self._unsub_capture()
+            self._unsub_capture = None
+        if (capture := self.api.capture) is None:
+            return
+        self.api.capture = None
+        self.hass.async_create_task(self._async_finish_capture(capture))
+
+    async def _async_finish_capture(self, capture: TrafficCapture) -> None:
+        """Write the rest of a stopped capture."""
+        await self.hass.async_add_executor_job(capture.write, capture.take_pending())
+        _LOGGER.info("Saved We-Wash traffic capture to %s", capture.path)
+
+    async def _async_write_capture(self) -> None:
+        """Append the responses of the last cycle to the capture file."""
+        if (capture := self.api.capture) is not None:
+            await self.hass.async_add_executor_job(capture.write, capture.take_pending())
+
+    @callback
+    def async_invalidate(self, *sections: str) -> None:
+        """Refresh the given data sections on the next update.
+
+        Without arguments every section is refreshed.
+        """
+        self._cache.invalidate(*sections)
 
     async def _async_update_data(self):
         """Fetch data from We-Wash API."""
         _LOGGER.debug("Starting data update from We-Wash API")
+        if self.api.capture is not None:
+            self.api.capture.next_cycle()
+        start = time.monotonic()
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed as error:
+            retry_after = getattr(error.__cause__, "retry_after", None)
+            self.update_interval = self.circuit.record_failure(
+                self.update_interval, retry_after
+            )
+            if (data := self._stale_data(self._failed_sections)) is None:
+                raise
+            # The reservations may have arrived before another section failed
+            self._async_observe_cycles(data)
+            _LOGGER.warning(
+                "Serving cached We-Wash data for %s: %s",
+                ", ".join(sorted(self.stale_sections)),
+                error,
+            )
+            return data
+        finally:
+            self.api.stats.cycles.record((time.monotonic() - start) * 1000)
+            await self._async_write_capture()
+        self.circuit.record_success()
+        return data
+
+    def _stale_data(self, failed: set[str]) -> dict[str, Any] | None:
+        """Return the cached data if it may still be served after a failure.
+
+        Every failed section must have been failing for less than the stale
+        window, counted from its first failure rather than from its fetch:
+        a section with a long TTL is older than the window once it is due.
+        Optional sections are served at any age.
+        """
+        if not self.data or self.restored:
+            return None
+        now = time.monotonic()
+        window = self.stale_window.total_seconds()
+        for key in failed:
+            since = self._failing_since.setdefault(key, now)
+            if key in OPTIONAL_ENDPOINTS:
+                continue
+            if self._cache.get(key) is None or now - since >= window:
+                return None
+        self.stale_sections.update(failed)
+        return self._cache.as_dict()
+
+    async def async_refresh_sections(self, *sections: str) -> None:
+        """Fetch only the given sections now and notify about the changes.
+
+        Unlike a regular update, stale sections not asked for are left
+        to the next scheduled update. If the refresh fails, an optimistic
+        result is withdrawn.
+        """
+        try:
+            data = await self._async_fetch_data(list(sections))
+        except UpdateFailed as error:
+            if (confirmed := self._confirmed_data) is not None:
+                self._async_show_unconfirmed(confirmed)
+                self._confirmed_data = None
+            raise HomeAssistantError(
+                f"Refreshing {', '.join(sections)} failed: {error}"
+            ) from error
+        self.async_set_updated_data(data)
+
+    def _resolve_room(self, room_id: str | None) -> Room:
+        """Return the room a service call names, the first room by default."""
+        index = self.index
+        if room_id is None:
+            room = index.first_room
+        else:
+            room = next((room for key, room in index.rooms.items() if str(key) == room_id), None)
+        if room is None:
+            raise HomeAssistantError(f"Unknown laundry room {room_id}")
+        return room
+
+    async def async_create_reservation(self, room_id: str | None, kind: str) -> None:
+        """Reserve a washer or dryer in a laundry room.
+
+        The new reservation is shown right away and confirmed by a refresh
+        of the reservations and the room availability.
+        """
+        room = self._resolve_room(room_id)
+        response = await self._async_send(
+            "POST",
+            RESERVATIONS_PATH,
+            {"laundryRoomId": room.id, "serviceType": SERVICE_TYPES[kind]},
+        )
+        try:
+            reservation = Reservation.from_api(response)
+        except WeWashSchemaError:
+            reservation = None
+        if reservation is not None and reservation.appliance_short_name:
+            # The response may not name the room; it is the one reserved in
+            reservation = replace(reservation, room_id=room.id)
+            self._async_apply_optimistic(
+                reservations=(*_reservations(self.data or {}), reservation)
+            )
+        else:
+            # The backend did not say which machine; at least one fewer is free
+            available = "available_washers" if kind == APPLIANCE_WASHER else "available_dryers"
+            self._async_apply_optimistic(
+                room=replace(room, **{available: max(0, getattr(room, available) - 1)})
+            )
+        await self.async_refresh_sections(*RESERVATION_SECTIONS)
+
+    async def async_cancel_reservation(self, room_id: str | None, short_name: str) -> None:
+        """Cancel the reservation of an appliance."""
+        room = self._resolve_room(room_id)
+        reservation = self.index.reservations.get((room.id, short_name))
+        if reservation is None or reservation.reservation_id is None:
+            raise HomeAssistantError(f"No reservation of {short_name} in room {room.id}")
+        await self._async_send(
+            "DELETE",
+            RESERVATION_PATH.format(reservation_id=reservation.reservation_id),
+            stats_key=RESERVATION_PATH,
+        )
+        self._async_apply_optimistic(
+            reservations=tuple(
+                item
+                for item in _reservations(self.data or {})
+                if item.reservation_id != reservation.reservation_id
+            )
+        )
+        await self.async_refresh_sections(*RESERVATION_SECTIONS)
+
+    async def _async_send(
+        self, method: str, path: str, payload: Any = None, stats_key: str | None = None
+    ) -> Any:
+        """Send a reservation action, raising errors for the service caller."""
+        try:
+            return await self.api.async_send(method, path, payload, stats_key)
+        except WeWashAuthError as error:
+            raise ConfigEntryAuthFailed("Invalid authentication") from error
+        except (asyncio.TimeoutError, aiohttp.ClientError, WeWashError) as error:
+            raise HomeAssistantError(f"We-Wash request failed: {error}") from error
+
+    @callback
+    def _async_apply_optimistic(
+        self,
+        reservations: tuple[Reservation, ...] | None = None,
+        room: Room | None = None,
+    ) -> None:
+        """Show the expected result of an action until it is confirmed."""
+        data = dict(self.data or {})
+        if reservations is not None:
+            data["reservations"] = Reservations(reservations)
+        if room is not None and isinstance(rooms := data.get("laundry_rooms"), LaundryRooms):
+            data["laundry_rooms"] = LaundryRooms(
+                tuple(room if item.id == room.id else item for item in rooms.rooms),
+                rooms.sending_times,
+            )
+        if self._confirmed_data is None:
+            self._confirmed_data = self.data
+        self._async_show_unconfirmed(data)
+
+    @callback
+    def _async_show_unconfirmed(self, data: dict[str, Any]) -> None:
+        """Push data to the entities without treating it as fetched."""
+        self.data = data
+        self._optimistic = True
+        try:
+            self.async_update_listeners()
+        finally:
+            self._optimistic = False
+
+    async def _async_fetch_data(self, keys: list[str] | None = None) -> dict[str, Any]:
+        """Fetch the given or all stale sections and merge them with the cache."""
+        if keys is None:
+            keys = self._cache.stale_keys()
+        # Until their results are in, all requested sections count as failed
+        self._failed_sections = set(keys)
         try:
-            async with async_timeout.timeout(30):
-                if not self.access_token:
-                    _LOGGER.debug("No access token found, authenticating...")
-                    await self._authenticate()
-
-                data = {}
-                async with aiohttp.ClientSession() as session:
-                    # Fetch user data
-                    headers = self._get_headers()
-                    _LOGGER.debug("Fetching user data...")
-                    async with session.get(USER_URL, headers=headers) as resp:
-                        if resp.status == 401:
-                            _LOGGER.debug("Access token expired, re-authenticating...")
-                            await self._authenticate()
-                            headers = self._get_headers()
-                            async with session.get(USER_URL, headers=headers) as resp:
-                                if resp.status >= 400:
-                                    raise UpdateFailed(f"API error {resp.status} from user endpoint")
-                                data["user"] = await resp.json()
-                        else:
-                            if resp.status >= 400:
-                                raise UpdateFailed(f"API error {resp.status} from user endpoint")
-                            data["user"] = await resp.json()
-                    
-                    # Fetch laundry rooms
-                    _LOGGER.debug("Fetching laundry rooms...")
-                    async with session.get(LAUNDRY_ROOMS_URL, headers=headers) as resp:
-                        if resp.status >= 400:
-                            raise UpdateFailed(f"API error {resp.status} from laundry rooms endpoint")
-                        data["laundry_rooms"] = await resp.json()
-                        
-                    # Fetch reservations
-                    _LOGGER.debug("Fetching reservations...")
-                    async with session.get(RESERVATIONS_URL, headers=headers) as resp:
-                        if resp.status >= 400:
-                            raise UpdateFailed(f"API error {resp.status} from reservations endpoint")
-                        data["reservations"] = await resp.json()
-                        
-                    # Fetch upcoming invoices
-                    _LOGGER.debug("Fetching upcoming invoices...")
-                    async with session.get(UPCOMING_INVOICES_URL, headers=headers) as resp:
-                        if resp.status >= 400:
-                            raise UpdateFailed(f"API error {resp.status} from invoices endpoint")
-                        data["invoices"] = await resp.json()
-
-                _LOGGER.debug("Successfully fetched all data from We-Wash API")
-                
-                # Log some key metrics for debugging
-                if "reservations" in data and "items" in data["reservations"]:
-                    _LOGGER.debug(f"Found {len(data['reservations']['items'])} reservations")
-                if "laundry_rooms" in data and "selectedLaundryRooms" in data["laundry_rooms"]:
-                    rooms = data["laundry_rooms"]["selectedLaundryRooms"]
-                    for room in rooms:
-                        washers = room["serviceAvailability"]["availableWashers"]
-                        dryers = room["serviceAvailability"]["availableDryers"]
-                        _LOGGER.debug(f"Room '{room['name']}': {washers} washers, {dryers} dryers available")
-
-                return data
+            results = await self._async_fetch_all(keys)
+
+            # Re-authenticate once and retry only the rejected requests
+            expired = {
+                key: result
+                for key, result in results.items()
+                if isinstance(result, WeWashTokenExpiredError)
+            }
+            if expired:
+                _LOGGER.debug("Access token expired, re-authenticating...")
+                rejected = next(iter(expired.values())).access_token
+                await self._authenticate(rejected)
+                results.update(await self._async_fetch_all(list(expired)))
+
+            # Keep what did arrive, a failed update may still serve it
+            for key, result in results.items():
+                if not isinstance(result, BaseException):
+                    self._cache.set(key, result)
+                    self.stale_sections.discard(key)
+                    self._failing_since.pop(key, None)
+            self._failed_sections = {
+                key for key, result in results.items() if isinstance(result, BaseException)
+            }
+
+            for key, result in results.items():
+                if isinstance(result, BaseException):
+                    if key not in OPTIONAL_ENDPOINTS:
+                        raise result
+                    _LOGGER.warning(
+                        "Failed to fetch %s, keeping previous data: %s", key, result
+                    )
+                    if self._cache.get(key) is not None:
+                        self.stale_sections.add(key)
+
+            # A finished or new reservation changes the upcoming invoice
+            if "reservations" in results and self.data:
+                if _reservation_ids(self.data) != _reservation_ids(
+                    self._cache.as_dict()
+                ):
+                    self._cache.invalidate("invoices")
+
+            data = self._cache.as_dict()
+
+            _LOGGER.debug("Successfully fetched data from We-Wash API")
+            
+            # Log some key metrics for debugging
+            if "reservations" in data:
+                _LOGGER.debug(f"Found {len(data['reservations'].items)} reservations")
+            if "laundry_rooms" in data:
+                for room in data["laundry_rooms"].rooms:
+                    washers = room.available_washers
+                    dryers = room.available_dryers
+                    _LOGGER.debug(f"Room '{room.name}': {washers} washers, {dryers} dryers available")
+
+            self.restored = False
+            self.data_updated_at = time.time()
+            # A cycle that started or ended changes the predicted finishes
+            self._async_observe_cycles(data)
+            self.update_interval = self._compute_update_interval(data)
+            _LOGGER.debug("Next update in %s", self.update_interval)
+
+            return data
 
         except asyncio.TimeoutError as error:
             _LOGGER.error(f"Timeout communicating with API: {error}")
             raise UpdateFailed(f"Timeout communicating with API: {error}") from error
-        except aiohttp.ClientError as error:
+        except WeWashAuthError as error:
+            raise ConfigEntryAuthFailed("Invalid authentication") from error
+        except WeWashSchemaError as error:
+            _LOGGER.error(f"Unexpected API response: {error}")
+            raise UpdateFailed(f"Unexpected API response: {error}") from error
+        except (aiohttp.ClientError, WeWashError) as error:
             _LOGGER.error(f"Error communicating with API: {error}")
             raise UpdateFailed(f"Error communicating with API: {error}") from error
         except (ValueError, KeyError) as error:
             _LOGGER.error(f"Error parsing API response: {error}")
             raise UpdateFailed(f"Error parsing API response: {error}") from error
+
+    def _compute_update_interval(self, data: dict[str, Section]) -> timedelta:
+        """Pick the next poll interval from the reservation state."""
+        reservations = _reservations(data)
+        now_ms = time.time() * 1000
+        intervals = []
+        for reservation in reservations:
+            finish = (
+                self.cycles.predicted_finish(reservation.reservation_id)
+                if reservation.status == "ACTIVE"
+                else None
+            )
+            if finish is not None:
+                # Poll rarely while the cycle runs, fast from shortly before its end
+                seconds_left = (finish - now_ms) / 1000 - FINISH_LEAD
+                intervals.append(
+                    min(PREDICTION_MAX_INTERVAL, max(ACTIVE_UPDATE_INTERVAL, seconds_left))
+                )
+            elif reservation.status in ACTIVE_STATUSES:
+                intervals.append(ACTIVE_UPDATE_INTERVAL)
+            else:
+                intervals.append(UPDATE_INTERVAL)
+        interval = min(intervals, default=IDLE_UPDATE_INTERVAL)
+
+        # Keep the polls of several entries apart
+        if self.api.scheduler is not None:
+            interval = self.api.scheduler.align(self.entry.entry_id, interval)
+
+        # Wake up right after the nearest known timeout
+        for reservation in reservations:
+            timeout_timestamp = reservation.timeout_timestamp
+            if not timeout_timestamp or timeout_timestamp <= now_ms:
+                continue
+            seconds_left = (timeout_timestamp - now_ms) / 1000
+            if seconds_left <= TIMEOUT_PROXIMITY:
+                interval = min(interval, ACTIVE_UPDATE_INTERVAL)
+            interval = min(interval, seconds_left + TIMEOUT_GRACE)
+
+        return timedelta(seconds=max(MIN_UPDATE_INTERVAL, interval))
+
+    async def _async_fetch_all(self, keys: list[str]) -> dict[str, Any]:
+        """Fetch several endpoints concurrently.
+
+        Failures are returned in place of the data so a single endpoint
+        cannot abort the others.
+        """
+        results = await asyncio.gather(
+            *(self._async_fetch_endpoint(key) for key in keys),
+            return_exceptions=True,
+        )
+        return dict(zip(keys, results))
+
+    async def _async_fetch_endpoint(self, key: str) -> Section:
+        """Fetch and parse a single endpoint."""
+        _LOGGER.debug("Fetching %s...", key)
+        section = parse_section(key, await self.api.async_get(ENDPOINTS[key]))
+        if isinstance(section, LaundryRooms) and self.room_cache is not None:
+            section = self.room_cache.intern_rooms(section)
+        return section
+
+    def _intern(self, data: dict[str, Section]) -> dict[str, Section]:
+        """Replace the rooms of parsed data by the shared instances."""
+        rooms = data.get("laundry_rooms")
+        if isinstance(rooms, LaundryRooms) and self.room_cache is not None:
+            data["laundry_rooms"] = self.room_cache.intern_rooms(rooms)
+        return data
             
-    async def _authenticate(self):
-        """Authenticate with the We-Wash API."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                # If we have a refresh token, try to use it first
-                if self.refresh_token:
-                    try:
-                        headers = {
-                            "accept": "application/json",
-                            "ww-app-version": "2.68.0",
-                            "ww-client": "USERAPP",
-                            "cookie": f"ww_refresh={self.refresh_token}",
-                        }
-                        async with session.get(AUTH_REFRESH_URL, headers=headers) as resp:
-                            if resp.status == 200:
-                                # Extract tokens from cookies
-                                cookies = resp.cookies
-                                self.access_token = cookies.get("ww_access")
-                                self.refresh_token = cookies.get("ww_refresh")
-                                return
-                    except aiohttp.ClientError:
-                        # If refresh fails, fall back to full authentication
-                        pass
-                
-                # Full authentication with username/password
-                data = {
-                    "username": self.entry.data["username"],
-                    "password": self.entry.data["password"],
-                }
-                headers = {
-                    "accept": "application/json",
-                    "content-type": "application/json",
-                    "ww-app-version": "2.68.0",
-                    "ww-client": "USERAPP",
-                }
-                async with session.post(AUTH_URL, json=data, headers=headers) as resp:
-                    if resp.status != 200:
-                        raise ConfigEntryAuthFailed("Invalid authentication")
-                    
-                    # Extract tokens from cookies
-                    cookies = resp.cookies
-                    self.access_token = cookies.get("ww_access")
-                    self.refresh_token = cookies.get("ww_refresh")
-
-        except aiohttp.ClientError as error:
-            raise ConfigEntryAuthFailed from error
-
-    def _get_headers(self):
-        """Get headers for API requests."""
-        return {
-            "accept": "application/json",
-            "ww-app-version": "2.68.0",
-            "ww-client": "USERAPP",
-            "cookie": f"ww_access={self.access_token}; ww_refresh={self.refresh_token}",
-        }
+    async def _authenticate(self, rejected_token: str | None = None):
+        """Authenticate with the We-Wash API.
+
+        Only rejected credentials raise ConfigEntryAuthFailed; network
+        errors fail the update like any other request.
+        """
+        await self.api.auth.async_authenticate(rejected_token)
+        self._cache.invalidate("user")
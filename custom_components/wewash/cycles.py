@@ -0,0 +1,224 @@
+"""History of appliance cycle durations for finish time predictions."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from statistics import median
+from typing import Any
+
+from .const import (
+    APPLIANCE_WASHER,
+    CYCLE_HISTORY_SIZE,
+    CYCLE_MAX_DURATION,
+    CYCLE_MIN_DURATION,
+    CYCLE_MIN_SAMPLES,
+    CYCLE_OBSERVATION_GAP,
+)
+from .index import ApplianceKey, WeWashIndex
+
+
+@dataclass
+class ApplianceCycles:
+    """Durations of the last completed cycles of one appliance (seconds)."""
+
+    kind: str
+    durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=CYCLE_HISTORY_SIZE)
+    )
+
+
+@dataclass
+class RunningCycle:
+    """A cycle that has started and not ended yet."""
+
+    key: ApplianceKey
+    kind: str
+    # Unix time in milliseconds, like the API timestamps
+    started: float
+
+
+class CycleHistory:
+    """Learn how long the cycles of every appliance take.
+
+    A cycle starts when a reservation turns ACTIVE, at its
+    statusChangedTimestamp. It ends at the next status change of the
+    reservation, or when the reservation disappears, at the first fetch
+    that no longer lists it. Only the last CYCLE_HISTORY_SIZE durations
+    of each appliance are kept, and predictions use their median.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the history."""
+        self.appliances: dict[ApplianceKey, ApplianceCycles] = {}
+        self.running: dict[Any, RunningCycle] = {}
+        self._observed_at: float | None = None
+
+    def observe(self, index: WeWashIndex, observed_at: float) -> bool:
+        """Follow the reservations fetched at observed_at (Unix time in ms).
+
+        Returns whether the history changed.
+        """
+        if observed_at == self._observed_at:
+            return False
+        # After a restart or an outage the end of a vanished cycle is unknown
+        reliable = (
+            self._observed_at is not None
+            and observed_at - self._observed_at <= CYCLE_OBSERVATION_GAP * 1000
+        )
+        self._observed_at = observed_at
+        changed = False
+
+        current = {
+            reservation.reservation_id: (key, reservation)
+            for key, reservation in index.reservations.items()
+            if reservation.reservation_id is not None
+        }
+        for reservation_id, (key, reservation) in current.items():
+            started = reservation.status_changed_timestamp
+            if (
+                reservation.status == "ACTIVE"
+                and reservation_id not in self.running
+                and started is not None
+            ):
+                self.running[reservation_id] = RunningCycle(
+                    key, index.appliances[key].kind, started
+                )
+                changed = True
+
+        for reservation_id, cycle in list(self.running.items()):
+            entry = current.get(reservation_id)
+            if entry is not None and entry[1].status == "ACTIVE":
+                continue
+            del self.running[reservation_id]
+            changed = True
+            ended = entry[1].status_changed_timestamp if entry is not None else None
+            if ended is None or ended <= cycle.started:
+                if not reliable:
+                    continue
+                ended = observed_at
+            self._record(cycle, (ended - cycle.started) / 1000)
+
+        return changed
+
+    def _record(self, cycle: RunningCycle, duration: float) -> None:
+        """Add the duration of a completed cycle, unless it is implausible."""
+        # Cancelled right after the start, or the end went unnoticed
+        if not CYCLE_MIN_DURATION <= duration <= CYCLE_MAX_DURATION:
+            return
+        if (cycles := self.appliances.get(cycle.key)) is None:
+            cycles = self.appliances[cycle.key] = ApplianceCycles(cycle.kind)
+        cycles.durations.append(duration)
+
+    def typical_duration(
+        self, kind: str, key: ApplianceKey | None = None
+    ) -> float | None:
+        """Return the median cycle duration of an appliance in seconds.
+
+        Appliances with too few cycles of their own use the cycles of all
+        appliances of their kind.
+        """
+        cycles = self.appliances.get(key) if key is not None else None
+        if cycles is not None and len(cycles.durations) >= CYCLE_MIN_SAMPLES:
+            return median(cycles.durations)
+        pooled = [
+            duration
+            for cycles in self.appliances.values()
+            if cycles.kind == kind
+            for duration in cycles.durations
+        ]
+        return median(pooled) if len(pooled) >= CYCLE_MIN_SAMPLES else None
+
+    def predicted_finish(self, reservation_id: Any) -> float | None:
+        """Return when a running cycle should end (Unix time in ms)."""
+        if (cycle := self.running.get(reservation_id)) is None:
+            return None
+        if (typical := self.typical_duration(cycle.kind, cycle.key)) is None:
+            return None
+        return cycle.started + typical * 1000
+
+    def next_finish(self, room_id: Any, kind: str) -> float | None:
+        """Return when the first running cycle of a kind in a room should end (ms)."""
+        return min(
+            (
+                finish
+                for reservation_id, cycle in self.running.items()
+                if cycle.key[0] == room_id
+                and cycle.kind == kind
+                and (finish := self.predicted_finish(reservation_id)) is not None
+            ),
+            default=None,
+        )
+
+    def expected_wait(
+        self, index: WeWashIndex, room_id: Any, kind: str, now: float
+    ) -> float | None:
+        """Return the expected wait for a free appliance in seconds.
+
+        The backend tells how many appliances are free, not when the busy
+        ones started. A busy appliance at an unknown point of its cycle has
+        half a typical cycle left on average; the account's own running
+        cycles are predicted exactly.
+        """
+        if (room := index.rooms.get(room_id)) is None:
+            return None
+        free = room.available_washers if kind == APPLIANCE_WASHER else room.available_dryers
+        if free:
+            return 0.0
+        waits = []
+        if (finish := self.next_finish(room_id, kind)) is not None:
+            waits.append(max(0.0, (finish - now) / 1000))
+        if (typical := self.typical_duration(kind)) is not None:
+            waits.append(typical / 2)
+        return min(waits, default=None)
+
+    def summary(self, key: ApplianceKey) -> dict[str, Any]:
+        """Return the statistics of the cycles of an appliance (minutes)."""
+        if (cycles := self.appliances.get(key)) is None or not cycles.durations:
+            return {"cycles": 0}
+        durations = cycles.durations
+        return {
+            "cycles": len(durations),
+            "typical_duration": round(median(durations) / 60, 1),
+            "shortest_duration": round(min(durations) / 60, 1),
+            "longest_duration": round(max(durations) / 60, 1),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the history for storage."""
+        return {
+            "appliances": [
+                {
+                    "room_id": key[0],
+                    "short_name": key[1],
+                    "kind": cycles.kind,
+                    "durations": list(cycles.durations),
+                }
+                for key, cycles in self.appliances.items()
+            ],
+            "running": [
+                {
+                    "reservation_id": reservation_id,
+                    "room_id": cycle.key[0],
+                    "short_name": cycle.key[1],
+                    "kind": cycle.kind,
+                    "started": cycle.started,
+                }
+                for reservation_id, cycle in self.running.items()
+            ],
+            "observed_at": self._observed_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CycleHistory:
+        """Restore a stored history."""
+        history = cls()
+        for item in data.get("appliances", []):
+            cycles = ApplianceCycles(item["kind"])
+            cycles.durations.extend(item["durations"])
+            history.appliances[(item["room_id"], item["short_name"])] = cycles
+        for item in data.get("running", []):
+            history.running[item["reservation_id"]] = RunningCycle(
+                (item["room_id"], item["short_name"]), item["kind"], item["started"]
+            )
+        history._observed_at = data.get("observed_at")
+        return history
@@ -0,0 +1,46 @@
+"""Diagnostics support for We-Wash."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, TO_REDACT
+from .coordinator import WeWashDataUpdateCoordinator
+from .models import sections_as_api
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: WeWashDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    auth = coordinator.api.auth
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "last_update_success": coordinator.last_update_success,
+        "consecutive_failures": coordinator.circuit.failures,
+        "circuit_open": coordinator.circuit.is_open,
+        "restored": coordinator.restored,
+        "stale_window": coordinator.stale_window.total_seconds(),
+        "stale_sections": sorted(coordinator.stale_sections),
+        "data_age": coordinator.data_age(),
+        "token_expires_at": auth.expires_at,
+        "performance": coordinator.api.stats.as_dict(),
+        "request_budget": (
+            coordinator.api.scheduler.as_dict() if coordinator.api.scheduler else None
+        ),
+        "cycle_history": {
+            f"{room_id} {short_name}": coordinator.cycles.summary((room_id, short_name))
+            for room_id, short_name in coordinator.cycles.appliances
+        },
+        "running_cycles": len(coordinator.cycles.running),
+        "room_cache": (
+            coordinator.room_cache.as_dict() if coordinator.room_cache else None
+        ),
+        "data": async_redact_data(sections_as_api(coordinator.data or {}), TO_REDACT),
+    }
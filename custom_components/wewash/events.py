@@ -0,0 +1,110 @@
+"""Reservation events computed from consecutive updates."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    EVENT_APPLIANCE_OFFLINE,
+    EVENT_APPLIANCE_ONLINE,
+    EVENT_QUEUE_POSITION_CHANGED,
+    EVENT_RESERVATION_CREATED,
+    EVENT_RESERVATION_FINISHED,
+    EVENT_RESERVATION_REMOVED,
+    EVENT_RESERVATION_STARTED,
+    EVENT_RESERVATION_STATUS_CHANGED,
+    EVENT_RESERVATION_TIMED_OUT,
+)
+from .index import WeWashIndex, appliance_kind
+from .models import Reservation
+
+ReservationEvent = tuple[str, dict[str, Any]]
+
+
+def _timestamp(milliseconds: float | None) -> str | None:
+    """Return an API timestamp as an ISO string."""
+    if milliseconds is None:
+        return None
+    return dt_util.utc_from_timestamp(milliseconds / 1000).isoformat()
+
+
+def _event_data(
+    index: WeWashIndex,
+    reservation: Reservation,
+    previous: Reservation | None,
+) -> dict[str, Any]:
+    """Return the data of an event about a reservation."""
+    room_id = reservation.room_id
+    if room_id not in index.rooms:
+        room_id = index.first_room_id
+    room = index.rooms.get(room_id)
+    short_name = reservation.appliance_short_name
+    return {
+        "reservation_id": reservation.reservation_id,
+        "room_id": room_id,
+        "room_name": room.name if room else None,
+        "appliance": short_name,
+        "appliance_kind": (
+            appliance_kind(short_name, reservation.service_type) if short_name else None
+        ),
+        "status": reservation.status,
+        "previous_status": previous.status if previous else None,
+        "queue_position": reservation.queue_position,
+        "previous_queue_position": previous.queue_position if previous else None,
+        "appliance_online": reservation.appliance_online,
+        "timeout": _timestamp(reservation.timeout_timestamp),
+    }
+
+
+def _by_id(reservations: tuple[Reservation, ...]) -> dict[Any, Reservation]:
+    """Return the reservations that have an id, by id."""
+    return {
+        reservation.reservation_id: reservation
+        for reservation in reservations
+        if reservation.reservation_id is not None
+    }
+
+
+def reservation_events(
+    previous_index: WeWashIndex,
+    previous: tuple[Reservation, ...],
+    index: WeWashIndex,
+    current: tuple[Reservation, ...],
+) -> list[ReservationEvent]:
+    """Return the events describing how the reservations changed."""
+    before = _by_id(previous)
+    after = _by_id(current)
+    events: list[ReservationEvent] = []
+
+    for reservation_id, reservation in after.items():
+        old = before.get(reservation_id)
+        data = _event_data(index, reservation, old)
+        if old is None:
+            events.append((EVENT_RESERVATION_CREATED, data))
+            continue
+        if reservation.status != old.status:
+            if reservation.status == "ACTIVE":
+                events.append((EVENT_RESERVATION_STARTED, data))
+            elif reservation.status == "RESERVATION_TIMED_OUT":
+                events.append((EVENT_RESERVATION_TIMED_OUT, data))
+            else:
+                events.append((EVENT_RESERVATION_STATUS_CHANGED, data))
+        if reservation.queue_position != old.queue_position:
+            events.append((EVENT_QUEUE_POSITION_CHANGED, data))
+        if old.appliance_online and reservation.appliance_online is False:
+            events.append((EVENT_APPLIANCE_OFFLINE, data))
+        elif old.appliance_online is False and reservation.appliance_online:
+            events.append((EVENT_APPLIANCE_ONLINE, data))
+
+    for reservation_id in before.keys() - after.keys():
+        old = before[reservation_id]
+        # A running cycle that disappears has finished
+        event_type = (
+            EVENT_RESERVATION_FINISHED
+            if old.status == "ACTIVE"
+            else EVENT_RESERVATION_REMOVED
+        )
+        events.append((event_type, _event_data(previous_index, old, old)))
+
+    return events
@@ -0,0 +1,114 @@
+"""Lookup index over the We-Wash data."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import APPLIANCE_DRYER, APPLIANCE_WASHER
+from .models import (
+    Appliance,
+    Invoice,
+    LaundryRooms,
+    Reservation,
+    Reservations,
+    Room,
+    RoomId,
+)
+
+ApplianceKey = tuple[Any, str]
+# Listener context keys of the data of one room or one appliance
+Channel = tuple[Any, ...]
+
+
+def room_channel(room_id: Any) -> Channel:
+    """Return the channel of a laundry room."""
+    return ("room", room_id)
+
+
+def appliance_channel(key: ApplianceKey) -> Channel:
+    """Return the channel of an appliance."""
+    return ("appliance", *key)
+
+
+def room_reservations_channel(room_id: Any) -> Channel:
+    """Return the channel of the reservations of all appliances in a room."""
+    return ("room_reservations", room_id)
+
+
+def appliance_kind(short_name: str, service_type: str | None = None) -> str:
+    """Return whether an appliance is a washer or a dryer."""
+    if service_type == "DRYING":
+        return APPLIANCE_DRYER
+    if service_type == "WASHING":
+        return APPLIANCE_WASHER
+    # Dryers are named T1, T2, ... (Trockner), washers W1, W2, ...
+    return APPLIANCE_DRYER if short_name.upper().startswith("T") else APPLIANCE_WASHER
+
+
+@dataclass
+class WeWashIndex:
+    """Normalized view of one coordinator update.
+
+    Built once per refresh so entities can look up their data directly
+    instead of scanning the parsed sections on every state write.
+    """
+
+    reservations: dict[ApplianceKey, Reservation] = field(default_factory=dict)
+    appliances: dict[ApplianceKey, Appliance] = field(default_factory=dict)
+    rooms: dict[RoomId, Room] = field(default_factory=dict)
+    # sendingTime of each room in this entry's last response
+    sending_times: dict[RoomId, int | None] = field(default_factory=dict)
+    invoice: Invoice | None = None
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> WeWashIndex:
+        """Build the index from coordinator data."""
+        index = cls(invoice=data.get("invoices"))
+
+        laundry_rooms: LaundryRooms | None = data.get("laundry_rooms")
+        for pos, room in enumerate(laundry_rooms.rooms if laundry_rooms else ()):
+            index.rooms[room.id] = room
+            index.sending_times[room.id] = laundry_rooms.sending_time(pos)
+
+        first_room_id = index.first_room_id
+        reservations: Reservations | None = data.get("reservations")
+        for reservation in reservations.items if reservations else ():
+            short_name = reservation.appliance_short_name
+            if not short_name:
+                continue
+            # Reservations without a known room belong to the first room
+            room_id = reservation.room_id
+            if room_id not in index.rooms:
+                room_id = first_room_id
+            key = (room_id, short_name)
+            # Keep the first reservation per appliance, like the API order
+            index.reservations.setdefault(key, reservation)
+            if key not in index.appliances:
+                index.appliances[key] = Appliance(
+                    room_id, short_name, appliance_kind(short_name, reservation.service_type)
+                )
+
+        return index
+
+    @property
+    def first_room_id(self) -> RoomId | None:
+        """Return the id of the first selected laundry room."""
+        return next(iter(self.rooms), None)
+
+    @property
+    def first_room(self) -> Room | None:
+        """Return the first selected laundry room."""
+        return next(iter(self.rooms.values()), None)
+
+    def changed_channels(self, previous: WeWashIndex) -> set[Channel]:
+        """Return the rooms and appliances whose data differs from previous."""
+        changed: set[Channel] = {
+            room_channel(room_id)
+            for room_id in self.rooms.keys() | previous.rooms.keys()
+            if self.rooms.get(room_id) != previous.rooms.get(room_id)
+        }
+        for key in self.reservations.keys() | previous.reservations.keys():
+            if self.reservations.get(key) != previous.reservations.get(key):
+                changed.add(appliance_channel(key))
+                changed.add(room_reservations_channel(key[0]))
+        return changed
@@ -0,0 +1,172 @@
+"""Import invoice usage into Home Assistant long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import WeWashDataUpdateCoordinator
+from .models import Invoice
+
+if TYPE_CHECKING:
+    from homeassistant.components.recorder.models import (
+        StatisticData,
+        StatisticMetaData,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _increase(previous: float | None, value: float) -> float:
+    """Return how much a counter of the current billing period grew.
+
+    The invoice counters start over after every invoice, a drop means
+    the previous period was billed and the value is all new usage.
+    """
+    if previous is None or value < previous:
+        return value
+    return value - previous
+
+
+@dataclass
+class _Series:
+    """One statistic fed from an invoice field."""
+
+    statistic_id: str
+    name: str
+    field: str
+    # The last imported hour and its values
+    start: datetime | None = None
+    state: float | None = None
+    sum: float = 0.0
+    # Values before the last imported hour; a change within the same hour
+    # overwrites its point based on these
+    base_state: float | None = None
+    base_sum: float = 0.0
+
+    def restore(self, row: dict) -> None:
+        """Continue from the last point in the recorder."""
+        self.start = dt_util.utc_from_timestamp(row["start"])
+        self.state = self.base_state = row.get("state")
+        self.sum = self.base_sum = row.get("sum") or 0.0
+
+    def update(self, value: float, hour: datetime) -> StatisticData | None:
+        """Return the point to import for value, None when nothing changed."""
+        if self.start is not None and hour < self.start:
+            return None
+        if self.start is None or hour > self.start:
+            if value == self.state:
+                return None
+            self.base_state, self.base_sum = self.state, self.sum
+            self.start = hour
+        elif value == self.state:
+            return None
+        self.state = value
+        self.sum = self.base_sum + _increase(self.base_state, value)
+        point: StatisticData = {"start": hour, "state": value, "sum": self.sum}
+        return point
+
+
+class WeWashStatisticsImporter:
+    """Append the invoice amount and cycle counts to long-term statistics.
+
+    Each series keeps the last imported hour, so an update only adds the
+    point for the current hour. The recorder is queried once for where a
+    previous run left off.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: WeWashDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._lock = asyncio.Lock()
+        self._restored = False
+        prefix = f"{DOMAIN}:{entry.entry_id.lower()}"
+        self._series = {
+            "cost": _Series(f"{prefix}_cost", f"{entry.title} cost", "amount"),
+            "washing": _Series(
+                f"{prefix}_washing_cycles", f"{entry.title} washing cycles", "washing_cycles"
+            ),
+            "drying": _Series(
+                f"{prefix}_drying_cycles", f"{entry.title} drying cycles", "drying_cycles"
+            ),
+        }
+
+    @callback
+    def async_schedule_import(self) -> None:
+        """Import the current invoice after a successful update."""
+        coordinator = self._coordinator
+        if not coordinator.last_update_success or coordinator.restored:
+            return
+        invoice: Invoice | None = (coordinator.data or {}).get("invoices")
+        if invoice is None or "recorder" not in self._hass.config.components:
+            return
+        self._entry.async_create_background_task(
+            self._hass, self.async_import(invoice), f"{DOMAIN} statistics import"
+        )
+
+    async def async_import(self, invoice: Invoice) -> None:
+        """Add the points for the current hour."""
+        # The recorder and its dependencies are only needed once it runs
+        from homeassistant.components.recorder.statistics import (
+            async_add_external_statistics,
+        )
+
+        async with self._lock:
+            if not self._restored:
+                await self._async_restore()
+            hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+            for key, series in self._series.items():
+                if (value := getattr(invoice, series.field)) is None:
+                    continue
+                if (point := series.update(float(value), hour)) is None:
+                    continue
+                unit = invoice.currency if key == "cost" else None
+                async_add_external_statistics(
+                    self._hass, self._metadata(series, unit), [point]
+                )
+
+    async def _async_restore(self) -> None:
+        """Load the last imported point of every series."""
+        from homeassistant.components.recorder import get_instance
+        from homeassistant.components.recorder.statistics import get_last_statistics
+
+        for series in self._series.values():
+            last = await get_instance(self._hass).async_add_executor_job(
+                get_last_statistics,
+                self._hass,
+                1,
+                series.statistic_id,
+                True,
+                {"state", "sum"},
+            )
+            if rows := last.get(series.statistic_id):
+                series.restore(rows[0])
+        self._restored = True
+        _LOGGER.debug("Restored last imported We-Wash statistics")
+
+    @staticmethod
+    def _metadata(series: _Series, unit: str | None) -> StatisticMetaData:
+        """Return the metadata of a series."""
+        metadata: StatisticMetaData = {
+            "has_mean": False,
+            "has_sum": True,
+            "name": series.name,
+            "source": DOMAIN,
+            "statistic_id": series.statistic_id,
+            "unit_of_measurement": unit,
+        }
+        return metadata
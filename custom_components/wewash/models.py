@@ -0,0 +1,390 @@
+"""Typed model of the We-Wash API responses.
+
+Every response is validated and parsed once when it is fetched. Only the
+fields the integration uses are kept, in slotted frozen dataclasses that
+compare and hash by value. as_api() returns the kept fields in the shape
+of the API response, so parsing it again yields an equal object.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Union
+
+from .api import WeWashSchemaError
+
+RoomId = Union[int, str]
+
+_NUMBER = (int, float)
+_ID = (int, str)
+
+
+def _get(
+    data: dict[str, Any],
+    key: str,
+    kinds: type | tuple[type, ...],
+    where: str,
+    required: bool = False,
+) -> Any:
+    """Return a validated field of a JSON object, None when it is absent."""
+    value = data.get(key)
+    if value is None:
+        if required:
+            raise WeWashSchemaError(f"{where}.{key} is missing")
+        return None
+    # bool is an int, but never a valid number or id in this API
+    if not isinstance(value, kinds) or (isinstance(value, bool) and kinds is not bool):
+        raise WeWashSchemaError(
+            f"{where}.{key} has unexpected type {type(value).__name__}"
+        )
+    return value
+
+
+def _object(value: Any, where: str) -> dict[str, Any]:
+    """Return value if it is a JSON object."""
+    if not isinstance(value, dict):
+        raise WeWashSchemaError(f"{where} is not an object")
+    return value
+
+
+def _objects(data: dict[str, Any], key: str, where: str) -> list[dict[str, Any]]:
+    """Return a list of JSON objects, an absent list counts as empty."""
+    items = _get(data, key, list, where) or []
+    return [_object(item, f"{where}.{key}[{pos}]") for pos, item in enumerate(items)]
+
+
+def _compact(data: dict[str, Any]) -> dict[str, Any]:
+    """Drop empty fields from an API shaped dict."""
+    return {key: value for key, value in data.items() if value is not None}
+
+
+@dataclass(frozen=True, slots=True)
+class Cost:
+    """Price of one cycle."""
+
+    amount: float | None
+    currency: str | None
+
+    @classmethod
+    def from_api(cls, data: Any, where: str) -> Cost:
+        """Parse a washingCost/dryingCost object."""
+        data = _object(data, where)
+        return cls(
+            amount=_get(data, "costOnActive", _NUMBER, where),
+            currency=_get(data, "currencyCode", str, where),
+        )
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the cost in API shape."""
+        return _compact({"costOnActive": self.amount, "currencyCode": self.currency})
+
+
+@dataclass(frozen=True, slots=True)
+class Address:
+    """Postal address of a laundry room."""
+
+    street: str | None
+    house_number: str | None
+    postal_code: str | None
+    city: str | None
+
+    @classmethod
+    def from_api(cls, data: Any, where: str) -> Address:
+        """Parse an address object."""
+        data = _object(data, where)
+        return cls(
+            street=_get(data, "street", str, where),
+            house_number=_get(data, "houseNumber", str, where),
+            postal_code=_get(data, "postalCode", str, where),
+            city=_get(data, "city", str, where),
+        )
+
+    def __str__(self) -> str:
+        """Return the address on one line."""
+        return (
+            f"{self.street or ''} {self.house_number or ''}, "
+            f"{self.postal_code or ''} {self.city or ''}"
+        ).strip()
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the address in API shape."""
+        return _compact(
+            {
+                "street": self.street,
+                "houseNumber": self.house_number,
+                "postalCode": self.postal_code,
+                "city": self.city,
+            }
+        )
+
+
+# Weak-referenceable so the domain room cache can share instances
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class Room:
+    """A selected laundry room and its availability."""
+
+    id: RoomId
+    name: str | None
+    address: Address | None
+    washing: str | None
+    drying: str | None
+    available_washers: int
+    available_dryers: int
+    washing_cost: Cost | None
+    drying_cost: Cost | None
+    note: str | None
+    critical_note: str | None
+
+    @classmethod
+    def from_api(cls, data: Any, where: str = "room") -> Room:
+        """Parse a laundry room object."""
+        data = _object(data, where)
+        avail_where = f"{where}.serviceAvailability"
+        availability = _object(data.get("serviceAvailability") or {}, avail_where)
+        address = data.get("address")
+        washing_cost = data.get("washingCost")
+        drying_cost = data.get("dryingCost")
+        return cls(
+            id=_get(data, "id", _ID, where, required=True),
+            name=_get(data, "name", str, where),
+            address=Address.from_api(address, f"{where}.address") if address else None,
+            washing=_get(availability, "washing", str, avail_where),
+            drying=_get(availability, "drying", str, avail_where),
+            available_washers=_get(availability, "availableWashers", int, avail_where) or 0,
+            available_dryers=_get(availability, "availableDryers", int, avail_where) or 0,
+            washing_cost=(
+                Cost.from_api(washing_cost, f"{where}.washingCost") if washing_cost else None
+            ),
+            drying_cost=(
+                Cost.from_api(drying_cost, f"{where}.dryingCost") if drying_cost else None
+            ),
+            note=_get(data, "note", str, where),
+            critical_note=_get(data, "criticalNote", str, where),
+        )
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the room in API shape."""
+        return _compact(
+            {
+                "id": self.id,
+                "name": self.name,
+                "address": self.address.as_api() if self.address else None,
+                "serviceAvailability": _compact(
+                    {
+                        "washing": self.washing,
+                        "drying": self.drying,
+                        "availableWashers": self.available_washers,
+                        "availableDryers": self.available_dryers,
+                    }
+                ),
+                "washingCost": self.washing_cost.as_api() if self.washing_cost else None,
+                "dryingCost": self.drying_cost.as_api() if self.drying_cost else None,
+                "note": self.note,
+                "criticalNote": self.critical_note,
+            }
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Reservation:
+    """A reservation of the account."""
+
+    reservation_id: str | None
+    room_id: RoomId | None
+    appliance_short_name: str | None
+    service_type: str | None
+    status: str | None
+    appliance_online: bool | None
+    queue_position: int | None
+    status_changed_timestamp: int | None
+    timeout_timestamp: int | None
+
+    @classmethod
+    def from_api(cls, data: Any, where: str = "reservation") -> Reservation:
+        """Parse a reservation object."""
+        data = _object(data, where)
+        return cls(
+            reservation_id=_get(data, "reservationId", _ID, where),
+            room_id=_get(data, "laundryRoomId", _ID, where),
+            appliance_short_name=_get(data, "applianceShortName", str, where),
+            service_type=_get(data, "serviceType", str, where),
+            status=_get(data, "status", str, where),
+            appliance_online=_get(data, "applianceOnline", bool, where),
+            queue_position=_get(data, "queuePosition", int, where),
+            status_changed_timestamp=_get(data, "statusChangedTimestamp", _NUMBER, where),
+            timeout_timestamp=_get(data, "timeoutTimestamp", _NUMBER, where),
+        )
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the reservation in API shape."""
+        return _compact(
+            {
+                "reservationId": self.reservation_id,
+                "laundryRoomId": self.room_id,
+                "applianceShortName": self.appliance_short_name,
+                "serviceType": self.service_type,
+                "status": self.status,
+                "applianceOnline": self.appliance_online,
+                "queuePosition": self.queue_position,
+                "statusChangedTimestamp": self.status_changed_timestamp,
+                "timeoutTimestamp": self.timeout_timestamp,
+            }
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Appliance:
+    """A washer or dryer seen in the reservations."""
+
+    room_id: RoomId | None
+    short_name: str
+    kind: str
+
+
+@dataclass(frozen=True, slots=True)
+class User:
+    """The account profile."""
+
+    id: Any
+
+    @classmethod
+    def from_api(cls, data: Any) -> User:
+        """Parse the users/me response."""
+        data = _object(data, "user")
+        return cls(id=data.get("id"))
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the profile in API shape."""
+        return _compact({"id": self.id})
+
+
+@dataclass(frozen=True, slots=True)
+class LaundryRooms:
+    """The laundry-rooms response."""
+
+    rooms: tuple[Room, ...]
+    # sendingTime of each room. It changes with every response and is not
+    # a change of the rooms; kept out of Room so shared rooms stay equal
+    sending_times: tuple[int | None, ...] = field(default=(), compare=False)
+
+    @classmethod
+    def from_api(cls, data: Any) -> LaundryRooms:
+        """Parse the laundry-rooms response."""
+        data = _object(data, "laundry_rooms")
+        items = _objects(data, "selectedLaundryRooms", "laundry_rooms")
+        return cls(
+            tuple(
+                Room.from_api(room, f"selectedLaundryRooms[{pos}]")
+                for pos, room in enumerate(items)
+            ),
+            tuple(
+                _get(room, "sendingTime", _NUMBER, f"selectedLaundryRooms[{pos}]")
+                for pos, room in enumerate(items)
+            ),
+        )
+
+    def sending_time(self, pos: int) -> int | None:
+        """Return the sendingTime of the room at pos."""
+        return self.sending_times[pos] if pos < len(self.sending_times) else None
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the rooms in API shape."""
+        return {
+            "selectedLaundryRooms": [
+                _compact({**room.as_api(), "sendingTime": self.sending_time(pos)})
+                for pos, room in enumerate(self.rooms)
+            ]
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Reservations:
+    """The reservations response."""
+
+    items: tuple[Reservation, ...]
+
+    @classmethod
+    def from_api(cls, data: Any) -> Reservations:
+        """Parse the reservations response."""
+        data = _object(data, "reservations")
+        return cls(
+            tuple(
+                Reservation.from_api(item, f"items[{pos}]")
+                for pos, item in enumerate(_objects(data, "items", "reservations"))
+            )
+        )
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the reservations in API shape."""
+        return {"items": [item.as_api() for item in self.items]}
+
+
+@dataclass(frozen=True, slots=True)
+class Invoice:
+    """The upcoming invoice."""
+
+    amount: float | None
+    currency: str | None
+    payment_threshold: float | None
+    washing_cycles: int | None
+    drying_cycles: int | None
+    cumulative_invoicing_date: int | None
+
+    @classmethod
+    def from_api(cls, data: Any) -> Invoice:
+        """Parse the upcoming-invoices response."""
+        data = _object(data, "invoices")
+        return cls(
+            amount=_get(data, "amount", _NUMBER, "invoices"),
+            currency=_get(data, "currency", str, "invoices"),
+            payment_threshold=_get(
+                data, "selectedPaymentMethodThreshold", _NUMBER, "invoices"
+            ),
+            washing_cycles=_get(data, "washingCycles", int, "invoices"),
+            drying_cycles=_get(data, "dryingCycles", int, "invoices"),
+            cumulative_invoicing_date=_get(
+                data, "cumulativeInvoicingDate", _NUMBER, "invoices"
+            ),
+        )
+
+    def as_api(self) -> dict[str, Any]:
+        """Return the invoice in API shape."""
+        return _compact(
+            {
+                "amount": self.amount,
+                "currency": self.currency,
+                "selectedPaymentMethodThreshold": self.payment_threshold,
+                "washingCycles": self.washing_cycles,
+                "dryingCycles": self.drying_cycles,
+                "cumulativeInvoicingDate": self.cumulative_invoicing_date,
+            }
+        )
+
+
+Section = Union[User, LaundryRooms, Reservations, Invoice]
+
+# Model of each data section, keyed like ENDPOINTS
+SECTION_MODELS: dict[str, Any] = {
+    "user": User,
+    "laundry_rooms": LaundryRooms,
+    "reservations": Reservations,
+    "invoices": Invoice,
+}
+
+
+def parse_section(key: str, data: Any) -> Section:
+    """Parse the response of a data section."""
+    return SECTION_MODELS[key].from_api(data)
+
+
+def parse_sections(data: dict[str, Any]) -> dict[str, Section]:
+    """Parse API shaped data of several sections."""
+    return {
+        key: parse_section(key, value)
+        for key, value in data.items()
+        if key in SECTION_MODELS
+    }
+
+
+def sections_as_api(data: dict[str, Section]) -> dict[str, Any]:
+    """Return parsed sections in API shape."""
+    return {key: value.as_api() for key, value in data.items()}
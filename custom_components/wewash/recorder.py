@@ -0,0 +1,26 @@
+"""Integration platform for the recorder."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+
+
+@callback
+def exclude_attributes(hass: HomeAssistant) -> set[str]:
+    """Exclude volatile attributes from being recorded in the database.
+
+    They are derived from timestamps or the current time and have
+    dedicated timestamp and duration sensors.
+    """
+    return {
+        "timestamp",
+        "timestamp_raw",
+        "timeout",
+        "timeout_raw",
+        "remaining_minutes",
+        "last_update",
+        "due_date",
+        "due_in_days",
+        "payment_status",
+        "stale",
+        "data_updated_at",
+    }
@@ -0,0 +1,84 @@
+"""Retry and circuit breaker helpers for the We-Wash API."""
+from __future__ import annotations
+
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+import logging
+import random
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CIRCUIT_BASE_INTERVAL,
+    CIRCUIT_MAX_INTERVAL,
+    CIRCUIT_THRESHOLD,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay requested by a Retry-After header in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - dt_util.utcnow()).total_seconds())
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return the jittered delay before retry number attempt (0-based)."""
+    delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+class CircuitBreaker:
+    """Stretch the poll interval while the backend keeps failing.
+
+    After CIRCUIT_THRESHOLD consecutive failed updates the circuit opens
+    and the interval doubles with every further failure, up to
+    CIRCUIT_MAX_INTERVAL. A Retry-After from the backend is always
+    respected. The next scheduled update acts as the probe; its success
+    closes the circuit again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the circuit breaker."""
+        self.failures = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the backend is considered down."""
+        return self.failures >= CIRCUIT_THRESHOLD
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful update."""
+        if self.is_open:
+            _LOGGER.info("We-Wash backend recovered after %s failed updates", self.failures)
+        self.failures = 0
+
+    def record_failure(
+        self, interval: timedelta, retry_after: float | None = None
+    ) -> timedelta:
+        """Count a failed update and return the interval until the next one."""
+        self.failures += 1
+        seconds = interval.total_seconds()
+        if self.is_open:
+            stretched = CIRCUIT_BASE_INTERVAL * 2 ** (self.failures - CIRCUIT_THRESHOLD)
+            seconds = max(seconds, min(CIRCUIT_MAX_INTERVAL, stretched))
+            if self.failures == CIRCUIT_THRESHOLD:
+                _LOGGER.warning(
+                    "We-Wash backend unavailable, polling every %s s until it recovers",
+                    seconds,
+                )
+        if retry_after is not None:
+            seconds = max(seconds, retry_after)
+        return timedelta(seconds=seconds)
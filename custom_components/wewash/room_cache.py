@@ -0,0 +1,44 @@
+"""Laundry room data shared by all We-Wash config entries."""
+from __future__ import annotations
+
+from typing import Any
+from weakref import WeakValueDictionary
+
+from .models import LaundryRooms, Room, RoomId
+
+
+class RoomCache:
+    """Share one Room instance per laundry room across config entries.
+
+    Accounts of the same building see the same rooms. Equal rooms parsed
+    by different entries are replaced by the instance already held, so
+    each room and its availability exist once in memory. Rooms are held
+    weakly and disappear with the last entry referencing them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._rooms: WeakValueDictionary[RoomId, Room] = WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, room: Room) -> Room:
+        """Return the shared instance equal to room."""
+        cached = self._rooms.get(room.id)
+        if cached is not None and cached == room:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        self._rooms[room.id] = room
+        return room
+
+    def intern_rooms(self, laundry_rooms: LaundryRooms) -> LaundryRooms:
+        """Return laundry_rooms made of shared Room instances."""
+        return LaundryRooms(
+            tuple(self.intern(room) for room in laundry_rooms.rooms),
+            laundry_rooms.sending_times,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {"rooms": len(self._rooms), "hits": self.hits, "misses": self.misses}
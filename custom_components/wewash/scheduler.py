@@ -0,0 +1,163 @@
+"""Request budget shared by all We-Wash config entries."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+import logging
+import time
+from typing import Any
+
+from .const import (
+    GLOBAL_MAX_CONCURRENT,
+    GLOBAL_REQUEST_BURST,
+    GLOBAL_REQUEST_RATE,
+    SATURATION_LOG_INTERVAL,
+    SATURATION_WAIT,
+)
+from .stats import LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def request_slot(
+    scheduler: WeWashRequestScheduler | None,
+) -> AbstractAsyncContextManager[None]:
+    """Return the context to hold while a request runs."""
+    return scheduler.async_slot() if scheduler is not None else nullcontext()
+
+
+class WeWashRequestScheduler:
+    """Token bucket and concurrency cap for all requests to the backend.
+
+    Every request of every entry takes a token from a bucket refilled at
+    GLOBAL_REQUEST_RATE per second and holding at most
+    GLOBAL_REQUEST_BURST, and at most GLOBAL_MAX_CONCURRENT requests run
+    at once. Entries also get evenly spaced phases so their polls do not
+    fire in sync, and entries set up together take turns with their first
+    refresh.
+    """
+
+    def __init__(
+        self,
+        rate: float = GLOBAL_REQUEST_RATE,
+        burst: int = GLOBAL_REQUEST_BURST,
+        concurrency: int = GLOBAL_MAX_CONCURRENT,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        # Waiters take tokens in arrival order
+        self._bucket_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._entries: list[str] = []
+        self._warned_at: float | None = None
+        self._next_start = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.wait = LatencyHistogram()
+
+    def register(self, entry_id: str) -> None:
+        """Add a config entry to the poll phases."""
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove a config entry from the poll phases."""
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+
+    def align(self, entry_id: str, interval: float) -> float:
+        """Return an interval close to interval that lands on the entry's phase.
+
+        Entry n of N polls at n/N of the interval, the result lies
+        between half and one and a half intervals.
+        """
+        if len(self._entries) < 2 or entry_id not in self._entries:
+            return interval
+        phase = self._entries.index(entry_id) / len(self._entries) * interval
+        shift = (phase - (time.time() + interval)) % interval
+        if shift > interval / 2:
+            shift -= interval
+        return interval + shift
+
+    def startup_delay(self, requests: int) -> float:
+        """Return how long to wait before a first refresh of requests requests.
+
+        Consecutive calls are spaced by the time the bucket needs to refill
+        that many tokens; a lone call does not wait.
+        """
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + requests / self._rate
+        return start - now
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Wait for the budget to allow a request and hold a slot while it runs."""
+        start = time.monotonic()
+        await self._async_take_token()
+        async with self._semaphore:
+            waited = time.monotonic() - start
+            self.requests += 1
+            self.wait.record(waited * 1000)
+            if waited >= SATURATION_WAIT:
+                self._warn_saturated(waited)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    async def _async_take_token(self) -> None:
+        """Take a token from the bucket, waiting for the refill if needed."""
+        async with self._bucket_lock:
+            self._refill()
+            if self._tokens < 1:
+                self.throttled += 1
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def _warn_saturated(self, waited: float) -> None:
+        """Log that the request budget is exhausted, at most every few minutes."""
+        now = time.monotonic()
+        if self._warned_at is not None and now - self._warned_at < SATURATION_LOG_INTERVAL:
+            return
+        self._warned_at = now
+        _LOGGER.warning(
+            "We-Wash request budget saturated: a request waited %.1f s, "
+            "%s config entries share %.1f requests per second",
+            waited,
+            len(self._entries),
+            self._rate,
+        )
+
+    @property
+    def saturated(self) -> bool:
+        """Return whether recent requests had to wait for the budget."""
+        recent = self.wait.percentile(0.95)
+        return recent is not None and recent >= SATURATION_WAIT * 1000
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "saturated": self.saturated,
+            "wait": self.wait.as_dict(),
+        }
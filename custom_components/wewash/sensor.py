@@ -1,31 +1,71 @@
 """Sensor platform for We-Wash."""
 from __future__ import annotations
 
+from abc import abstractmethod
 from typing import Any, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
 
 from .const import (
+    APPLIANCE_DRYER,
+    APPLIANCE_WASHER,
     DOMAIN,
+    ENDPOINTS,
+    ICON_PERFORMANCE,
     ICON_WASHER,
     ICON_DRYER,
     ICON_INVOICE,
     ICON_LAUNDRY_ROOM,
+    ICON_RESERVATION,
+    ICON_TIMER,
     MANUFACTURER,
     MODEL,
 )
 from .coordinator import WeWashDataUpdateCoordinator
+from .index import (
+    ApplianceKey,
+    WeWashIndex,
+    appliance_channel,
+    room_channel,
+    room_reservations_channel,
+)
+from .models import Reservation
+
+# Per appliance type: display name, icon and the Room attributes holding
+# its availability flag, cost and counter
+APPLIANCE_TYPES: dict[str, dict[str, str]] = {
+    APPLIANCE_WASHER: {
+        "name": "Washer",
+        "icon": ICON_WASHER,
+        "service": "washing",
+        "cost": "washing_cost",
+        "available": "available_washers",
+    },
+    APPLIANCE_DRYER: {
+        "name": "Dryer",
+        "icon": ICON_DRYER,
+        "service": "drying",
+        "cost": "drying_cost",
+        "available": "available_dryers",
+    },
+}
 
 
 def format_timestamp(timestamp: Optional[int]) -> Optional[str]:
@@ -45,149 +85,213 @@ def get_remaining_minutes(timeout_timestamp: Optional[int]) -> Optional[int]:
     return max(0, remaining_time_minutes)  # Ensure we don't return negative minutes
 
 
-def get_machine_status(data: dict[str, Any], appliance_short_name: str) -> str:
+def get_machine_status(
+    index: WeWashIndex, room_id: Any, appliance_short_name: str, kind: str
+) -> str:
     """Get machine status based on reservations and laundry room data."""
     # Check reservations first
-    reservations = data.get("reservations", {}).get("items", [])
-    for reservation in reservations:
-        if reservation.get("applianceShortName") == appliance_short_name:
-            status = reservation.get("status")
-            if status == "ACTIVE":
-                return "running"
-            elif status == "READY":
-                return "reserved"
+    reservation = index.reservations.get((room_id, appliance_short_name))
+    if reservation:
+        status = reservation.status
+        if status == "ACTIVE":
+            return "running"
+        elif status == "READY":
+            return "reserved"
     
     # Check laundry room availability
-    laundry_rooms = data.get("laundry_rooms", {}).get("selectedLaundryRooms", [])
-    if laundry_rooms:
-        room = laundry_rooms[0]
-        if appliance_short_name == "W1":
-            available = room.get("serviceAvailability", {}).get("availableWashers", 0)
-            return "available" if available > 0 else "reserved"
-        elif appliance_short_name == "T1":
-            available = room.get("serviceAvailability", {}).get("availableDryers", 0)
-            return "available" if available > 0 else "reserved"
+    if room := index.rooms.get(room_id):
+        available = getattr(room, APPLIANCE_TYPES[kind]["available"])
+        return "available" if available > 0 else "reserved"
     
     return "available"
 
 
-def get_machine_reservation_data(data: dict[str, Any], appliance_short_name: str) -> dict[str, Any]:
+def get_machine_reservation_data(
+    index: WeWashIndex, room_id: Any, appliance_short_name: str
+) -> Reservation | None:
     """Get reservation data for a specific machine."""
-    reservations = data.get("reservations", {}).get("items", [])
-    for reservation in reservations:
-        if reservation.get("applianceShortName") == appliance_short_name:
-            return reservation
-    return {}
+    return index.reservations.get((room_id, appliance_short_name))
+
+
+def get_machine_timeout(
+    index: WeWashIndex, room_id: Any, appliance_short_name: str
+) -> datetime | None:
+    """Get the time the reservation of a machine times out."""
+    reservation = get_machine_reservation_data(index, room_id, appliance_short_name)
+    timeout_timestamp = reservation.timeout_timestamp if reservation else None
+    if timeout_timestamp is None:
+        return None
+    return dt_util.utc_from_timestamp(timeout_timestamp / 1000)
+
+
+def get_invoice_due_date(index: WeWashIndex) -> datetime | None:
+    """Get the due date of the upcoming invoice."""
+    if index.invoice is None:
+        return None
+    cumulative_invoicing_timestamp = index.invoice.cumulative_invoicing_date
+    if cumulative_invoicing_timestamp is None:
+        return None
+    return dt_util.utc_from_timestamp(cumulative_invoicing_timestamp / 1000)
+
+
+def appliance_key_name(
+    coordinator: WeWashDataUpdateCoordinator,
+    room_id: Any,
+    short_name: str,
+    kind: str,
+    legacy_key: str | None = None,
+) -> tuple[str, str]:
+    """Return the entity key and name of an appliance."""
+    type_name = APPLIANCE_TYPES[kind]["name"]
+    if legacy_key:
+        return legacy_key, f"{type_name} {short_name}"
+    room = coordinator.index.rooms.get(room_id)
+    room_name = room.name if room and room.name is not None else room_id
+    return f"room_{room_id}_{short_name.lower()}", f"{room_name} {type_name} {short_name}"
+
+
+def room_key_name(
+    coordinator: WeWashDataUpdateCoordinator,
+    room_id: Any,
+    legacy_key: str | None = None,
+) -> tuple[str, str]:
+    """Return the entity key and name of a laundry room."""
+    if legacy_key:
+        return legacy_key, "Laundry Room"
+    room = coordinator.index.rooms.get(room_id)
+    return f"room_{room_id}", (room and room.name) or f"Laundry Room {room_id}"
+
+
+def account_device_info(coordinator: WeWashDataUpdateCoordinator) -> DeviceInfo:
+    """Return the device of the We-Wash account."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, coordinator.entry.entry_id)},
+        name="We-Wash Laundry System",
+        manufacturer=MANUFACTURER,
+        model=MODEL,
+    )
+
+
+def room_device_info(coordinator: WeWashDataUpdateCoordinator, room_id: Any) -> DeviceInfo:
+    """Return the device of a laundry room."""
+    if room_id is None:
+        return account_device_info(coordinator)
+    room = coordinator.index.rooms.get(room_id)
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{coordinator.entry.entry_id}_{room_id}")},
+        name=(room and room.name) or f"Laundry Room {room_id}",
+        manufacturer=MANUFACTURER,
+        model=MODEL,
+        via_device=(DOMAIN, coordinator.entry.entry_id),
+    )
 
 
 class WeWashBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for WeWash sensors."""
 
+    # Data sections the state is rendered from; state is only written
+    # when one of them changes. Room and appliance entities pass the
+    # channels of their room or appliance instead.
+    _sections: frozenset[Any] = frozenset()
+    # Data sections the state comes from, to mark it stale while one of
+    # them serves cached data after a failed refresh
+    _data_sections: frozenset[str] = frozenset({"laundry_rooms", "reservations"})
+
     def __init__(
         self,
         coordinator: WeWashDataUpdateCoordinator,
-        entity_id: str,
+        key: str,
         name: str,
         icon: str,
+        device_info: DeviceInfo | None = None,
+        legacy_entity_id: bool = True,
+        channels: frozenset[Any] | None = None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_id = f"sensor.{entity_id}"
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_{entity_id}"
+        super().__init__(coordinator, context=channels or self._sections)
+        if legacy_entity_id:
+            self.entity_id = f"sensor.{key}"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{key}"
         self._attr_name = name
         self._attr_icon = icon
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.entry.entry_id)},
-            "name": "We-Wash Laundry System",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-        }
-
-
-class WeWashWasherSensor(WeWashBaseSensor):
-    """Washer W1 sensor entity."""
-
-    def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
-        """Initialize the washer sensor."""
-        super().__init__(coordinator, "washer_w1", "Washer W1", ICON_WASHER)
-
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the washer."""
-        return get_machine_status(self.coordinator.data, "W1")
+        self._attr_device_info = device_info or account_device_info(coordinator)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes."""
-        attrs = {}
-        
-        # Get laundry room data
-        laundry_rooms = self.coordinator.data.get("laundry_rooms", {}).get("selectedLaundryRooms", [])
-        if laundry_rooms:
-            room = laundry_rooms[0]
-            attrs["is_enabled"] = room.get("serviceAvailability", {}).get("washing") == "ENABLED"
-            attrs["price"] = room.get("washingCost", {}).get("costOnActive")
-            attrs["currency"] = room.get("washingCost", {}).get("currencyCode")
-          # Get reservation data
-        reservation_data = get_machine_reservation_data(self.coordinator.data, "W1")
-        if reservation_data:
-            attrs["is_online"] = reservation_data.get("applianceOnline")
-            attrs["reservation_id"] = reservation_data.get("reservationId")
-            attrs["queue_position"] = reservation_data.get("queuePosition")
-            
-            # Format timestamps for better readability
-            status_changed_timestamp = reservation_data.get("statusChangedTimestamp")
-            timeout_timestamp = reservation_data.get("timeoutTimestamp")
-            
-            # Original raw values (for compatibility)
-            attrs["timestamp_raw"] = status_changed_timestamp
-            attrs["timeout_raw"] = timeout_timestamp
-            
-            # Human-readable values
-            attrs["timestamp"] = format_timestamp(status_changed_timestamp)
-            attrs["timeout"] = format_timestamp(timeout_timestamp)
-            
-            # Add remaining time in minutes until timeout
-            attrs["remaining_minutes"] = get_remaining_minutes(timeout_timestamp)
-        
+        attrs = self._extra_attributes()
+        if self.coordinator.restored:
+            # Data restored from the previous run, not confirmed by the backend yet
+            attrs["stale"] = True
+        elif (updated_at := self.coordinator.stale_since(self._data_sections)) is not None:
+            # The backend failed, this is the last good data
+            attrs["stale"] = True
+            attrs["data_updated_at"] = dt_util.utc_from_timestamp(updated_at).isoformat()
         return attrs
 
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the entity specific state attributes."""
+        return {}
 
-class WeWashDryerSensor(WeWashBaseSensor):
-    """Dryer T1 sensor entity."""
 
-    def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
-        """Initialize the dryer sensor."""
-        super().__init__(coordinator, "dryer_t1", "Dryer T1", ICON_DRYER)
+class WeWashApplianceSensor(WeWashBaseSensor):
+    """Washer or dryer sensor entity."""
+
+    def __init__(
+        self,
+        coordinator: WeWashDataUpdateCoordinator,
+        room_id: Any,
+        short_name: str,
+        kind: str,
+        legacy_key: str | None = None,
+    ) -> None:
+        """Initialize the appliance sensor."""
+        key, name = appliance_key_name(coordinator, room_id, short_name, kind, legacy_key)
+        super().__init__(
+            coordinator,
+            key,
+            name,
+            APPLIANCE_TYPES[kind]["icon"],
+            room_device_info(coordinator, room_id),
+            legacy_entity_id=legacy_key is not None,
+            channels=frozenset(
+                {room_channel(room_id), appliance_channel((room_id, short_name))}
+            ),
+        )
+        self._room_id = room_id
+        self._short_name = short_name
+        self._kind = kind
 
     @property
     def native_value(self) -> StateType:
-        """Return the state of the dryer."""
-        return get_machine_status(self.coordinator.data, "T1")
+        """Return the state of the appliance."""
+        return get_machine_status(
+            self.coordinator.index, self._room_id, self._short_name, self._kind
+        )
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the entity specific state attributes."""
         attrs = {}
+        appliance_type = APPLIANCE_TYPES[self._kind]
         
         # Get laundry room data
-        laundry_rooms = self.coordinator.data.get("laundry_rooms", {}).get("selectedLaundryRooms", [])
-        if laundry_rooms:
-            room = laundry_rooms[0]
-            attrs["is_enabled"] = room.get("serviceAvailability", {}).get("drying") == "ENABLED"
-            attrs["price"] = room.get("dryingCost", {}).get("costOnActive")
-            attrs["currency"] = room.get("dryingCost", {}).get("currencyCode")
-          # Get reservation data
-        reservation_data = get_machine_reservation_data(self.coordinator.data, "T1")
+        index = self.coordinator.index
+        room = index.rooms.get(self._room_id)
+        if room:
+            cost = getattr(room, appliance_type["cost"])
+            attrs["is_enabled"] = getattr(room, appliance_type["service"]) == "ENABLED"
+            attrs["price"] = cost.amount if cost else None
+            attrs["currency"] = cost.currency if cost else None
+        # Get reservation data
+        reservation_data = get_machine_reservation_data(index, self._room_id, self._short_name)
         if reservation_data:
-            attrs["is_online"] = reservation_data.get("applianceOnline")
-            attrs["reservation_id"] = reservation_data.get("reservationId")
-            attrs["queue_position"] = reservation_data.get("queuePosition")
+            attrs["is_online"] = reservation_data.appliance_online
+            attrs["reservation_id"] = reservation_data.reservation_id
+            attrs["queue_position"] = reservation_data.queue_position
             
             # Format timestamps for better readability
-            status_changed_timestamp = reservation_data.get("statusChangedTimestamp")
-            timeout_timestamp = reservation_data.get("timeoutTimestamp")
+            status_changed_timestamp = reservation_data.status_changed_timestamp
+            timeout_timestamp = reservation_data.timeout_timestamp
             
             # Original raw values (for compatibility)
             attrs["timestamp_raw"] = status_changed_timestamp
@@ -206,49 +310,63 @@ class WeWashDryerSensor(WeWashBaseSensor):
 class WeWashLaundryRoomSensor(WeWashBaseSensor):
     """Laundry room sensor entity."""
 
-    def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
+    _data_sections = frozenset({"laundry_rooms"})
+
+    def __init__(
+        self,
+        coordinator: WeWashDataUpdateCoordinator,
+        room_id: Any,
+        legacy_key: str | None = None,
+    ) -> None:
         """Initialize the laundry room sensor."""
-        super().__init__(coordinator, "laundry_room", "Laundry Room", ICON_LAUNDRY_ROOM)
+        key, name = room_key_name(coordinator, room_id, legacy_key)
+        super().__init__(
+            coordinator,
+            key,
+            name,
+            ICON_LAUNDRY_ROOM,
+            room_device_info(coordinator, room_id),
+            legacy_entity_id=legacy_key is not None,
+            channels=frozenset({room_channel(room_id)}),
+        )
+        self._room_id = room_id
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the laundry room."""
-        laundry_rooms = self.coordinator.data.get("laundry_rooms", {}).get("selectedLaundryRooms", [])
-        if laundry_rooms:
-            room = laundry_rooms[0]
-            avail_washers = room.get("serviceAvailability", {}).get("availableWashers", 0)
-            avail_dryers = room.get("serviceAvailability", {}).get("availableDryers", 0)
+        if room := self.coordinator.index.rooms.get(self._room_id):
+            avail_washers = room.available_washers
+            avail_dryers = room.available_dryers
             return f"{avail_washers} washer(s), {avail_dryers} dryer(s) available"
         return "Unknown"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the entity specific state attributes."""
         attrs = {}
         
-        laundry_rooms = self.coordinator.data.get("laundry_rooms", {}).get("selectedLaundryRooms", [])
-        if laundry_rooms:
-            room = laundry_rooms[0]
-            attrs["id"] = room.get("id")
-            attrs["name"] = room.get("name")
+        index = self.coordinator.index
+        room = index.rooms.get(self._room_id)
+        if room:
+            attrs["id"] = room.id
+            attrs["name"] = room.name
             
             # Combine address
-            address_parts = room.get("address", {})
-            if address_parts:
-                full_address = f"{address_parts.get('street', '')} {address_parts.get('houseNumber', '')}, {address_parts.get('postalCode', '')} {address_parts.get('city', '')}"
-                attrs["address"] = full_address.strip()
+            if room.address:
+                attrs["address"] = str(room.address)
             
-            attrs["available_washers"] = room.get("serviceAvailability", {}).get("availableWashers")
-            attrs["available_dryers"] = room.get("serviceAvailability", {}).get("availableDryers")
-            attrs["note"] = room.get("note")
-            attrs["critical_note"] = room.get("criticalNote")
-            attrs["last_update"] = room.get("sendingTime")
+            attrs["available_washers"] = room.available_washers
+            attrs["available_dryers"] = room.available_dryers
+            attrs["note"] = room.note
+            attrs["critical_note"] = room.critical_note
+            attrs["last_update"] = index.sending_times.get(room.id)
         
         return attrs
 
 
 class WeWashNextInvoiceSensor(WeWashBaseSensor):
     """Next invoice sensor entity."""
+
+    _sections = _data_sections = frozenset({"invoices"})
     
     def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
         """Initialize the next invoice sensor."""
@@ -257,26 +375,27 @@ class WeWashNextInvoiceSensor(WeWashBaseSensor):
     @property
     def native_value(self) -> StateType:
         """Return the total amount of the next invoice."""
-        invoice_data = self.coordinator.data.get("invoices", {})
+        invoice_data = self.coordinator.index.invoice
         # Use the total amount directly from the invoice data
-        return invoice_data.get("amount", 0.0)
+        if invoice_data is None or invoice_data.amount is None:
+            return 0.0
+        return invoice_data.amount
     
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the entity specific state attributes."""
         attrs = {}
         
-        invoice_data = self.coordinator.data.get("invoices", {})
+        invoice_data = self.coordinator.index.invoice
         if invoice_data:
             # Payment information
-            attrs["currency"] = invoice_data.get("currency", "EUR")
-            attrs["payment_threshold"] = invoice_data.get("selectedPaymentMethodThreshold")
+            attrs["currency"] = invoice_data.currency or "EUR"
+            attrs["payment_threshold"] = invoice_data.payment_threshold
               # Usage statistics - group related attributes
-            attrs["usage_washing_cycles"] = invoice_data.get("washingCycles", 0)
-            attrs["usage_drying_cycles"] = invoice_data.get("dryingCycles", 0)
+            attrs["usage_washing_cycles"] = invoice_data.washing_cycles or 0
+            attrs["usage_drying_cycles"] = invoice_data.drying_cycles or 0
             
             # Due date information - improve formatting and clarity
-            cumulative_invoicing_timestamp = invoice_data.get("cumulativeInvoicingDate")
+            cumulative_invoicing_timestamp = invoice_data.cumulative_invoicing_date
             if cumulative_invoicing_timestamp:
                 # Format the due date in a more user-friendly way
                 due_date = datetime.fromtimestamp(cumulative_invoicing_timestamp / 1000)
@@ -297,6 +416,357 @@ class WeWashNextInvoiceSensor(WeWashBaseSensor):
         return attrs
 
 
+class WeWashCountdownSensor(WeWashBaseSensor):
+    """Base class for sensors counting down to a deadline.
+
+    The value is recomputed locally whenever it crosses a unit boundary,
+    independent of the coordinator polling the backend.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _unit: timedelta = timedelta(minutes=1)
+    _unsub_countdown: CALLBACK_TYPE | None = None
+
+    @abstractmethod
+    def _deadline(self) -> datetime | None:
+        """Return the deadline counted down to."""
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the whole units left until the deadline."""
+        if (deadline := self._deadline()) is None:
+            return None
+        return max(0, int((deadline - dt_util.utcnow()) / self._unit))
+
+    async def async_added_to_hass(self) -> None:
+        """Start counting down."""
+        await super().async_added_to_hass()
+        self._async_schedule_countdown()
+        self.async_on_remove(self._async_cancel_countdown)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a new deadline from the coordinator."""
+        self._async_schedule_countdown()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_countdown(self) -> None:
+        """Stop counting down."""
+        if self._unsub_countdown is not None:
+            self._unsub_countdown()
+            self._unsub_countdown = None
+
+    @callback
+    def _async_schedule_countdown(self) -> None:
+        """Schedule an update for the moment the value changes next."""
+        self._async_cancel_countdown()
+        now = dt_util.utcnow()
+        if (deadline := self._deadline()) is None or deadline <= now:
+            return
+        units_left = int((deadline - now) / self._unit)
+        next_change = deadline - units_left * self._unit
+        if next_change <= now:
+            next_change += self._unit
+        self._unsub_countdown = async_track_point_in_utc_time(
+            self.hass, self._async_countdown_tick, next_change
+        )
+
+    @callback
+    def _async_countdown_tick(self, _: datetime) -> None:
+        """Write the new value and wait for the next change."""
+        self._unsub_countdown = None
+        self._async_schedule_countdown()
+        self.async_write_ha_state()
+
+
+class WeWashReservationTimeoutSensor(WeWashBaseSensor):
+    """Time the reservation of an appliance times out."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(
+        self,
+        coordinator: WeWashDataUpdateCoordinator,
+        room_id: Any,
+        short_name: str,
+        kind: str,
+        legacy_key: str | None = None,
+    ) -> None:
+        """Initialize the reservation timeout sensor."""
+        key, name = appliance_key_name(coordinator, room_id, short_name, kind, legacy_key)
+        super().__init__(
+            coordinator,
+            f"{key}_timeout",
+            f"{name} Timeout",
+            ICON_RESERVATION,
+            room_device_info(coordinator, room_id),
+            legacy_entity_id=legacy_key is not None,
+            channels=frozenset({appliance_channel((room_id, short_name))}),
+        )
+        self._room_id = room_id
+        self._short_name = short_name
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the time the reservation times out."""
+        return get_machine_timeout(self.coordinator.index, self._room_id, self._short_name)
+
+
+class WeWashReservationRemainingSensor(WeWashCountdownSensor):
+    """Minutes left until the reservation of an appliance times out."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+
+    def __init__(
+        self,
+        coordinator: WeWashDataUpdateCoordinator,
+        room_id: Any,
+        short_name: str,
+        kind: str,
+        legacy_key: str | None = None,
+    ) -> None:
+        """Initialize the remaining time sensor."""
+        key, name = appliance_key_name(coordinator, room_id, short_name, kind, legacy_key)
+        super().__init__(
+            coordinator,
+            f"{key}_remaining",
+            f"{name} Remaining",
+            ICON_TIMER,
+            room_device_info(coordinator, room_id),
+            legacy_entity_id=legacy_key is not None,
+            channels=frozenset({appliance_channel((room_id, short_name))}),
+        )
+        self._room_id = room_id
+        self._short_name = short_name
+
+    def _deadline(self) -> datetime | None:
+        """Return the time the reservation times out."""
+        return get_machine_timeout(self.coordinator.index, self._room_id, self._short_name)
+
+
+class WeWashInvoiceDueDateSensor(WeWashBaseSensor):
+    """Due date of the upcoming invoice."""
+
+    _sections = _data_sections = frozenset({"invoices"})
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
+        """Initialize the invoice due date sensor."""
+        super().__init__(coordinator, "invoice_due_date", "Invoice Due Date", ICON_INVOICE)
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the due date of the upcoming invoice."""
+        return get_invoice_due_date(self.coordinator.index)
+
+
+class WeWashInvoiceDueInDaysSensor(WeWashCountdownSensor):
+    """Days left until the upcoming invoice is due."""
+
+    _sections = _data_sections = frozenset({"invoices"})
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _unit = timedelta(days=1)
+
+    def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
+        """Initialize the invoice countdown sensor."""
+        super().__init__(coordinator, "invoice_due_in_days", "Invoice Due In", ICON_INVOICE)
+
+    def _deadline(self) -> datetime | None:
+        """Return the due date of the upcoming invoice."""
+        return get_invoice_due_date(self.coordinator.index)
+
+
+class WeWashPredictedFinishSensor(WeWashBaseSensor):
+    """Predicted end of the running cycle of an appliance."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(
+        self,
+        coordinator: WeWashDataUpdateCoordinator,
+        room_id: Any,
+        short_name: str,
+        kind: str,
+        legacy_key: str | None = None,
+    ) -> None:
+        """Initialize the predicted finish sensor."""
+        key, name = appliance_key_name(coordinator, room_id, short_name, kind, legacy_key)
+        super().__init__(
+            coordinator,
+            f"{key}_predicted_finish",
+            f"{name} Predicted Finish",
+            ICON_TIMER,
+            room_device_info(coordinator, room_id),
+            legacy_entity_id=legacy_key is not None,
+            channels=frozenset({appliance_channel((room_id, short_name))}),
+        )
+        self._room_id = room_id
+        self._short_name = short_name
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the running cycle should end."""
+        reservation = get_machine_reservation_data(
+            self.coordinator.index, self._room_id, self._short_name
+        )
+        if reservation is None or reservation.status != "ACTIVE":
+            return None
+        finish = self.coordinator.cycles.predicted_finish(reservation.reservation_id)
+        return dt_util.utc_from_timestamp(finish / 1000) if finish is not None else None
+
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the cycle statistics of the appliance."""
+        return self.coordinator.cycles.summary((self._room_id, self._short_name))
+
+
+class WeWashExpectedWaitSensor(WeWashCountdownSensor):
+    """Expected wait for a free washer or dryer in a laundry room.
+
+    Counts down to the predicted end of the account's own cycles; the
+    estimate for the cycles of others does not depend on the time.
+    """
+
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+
+    def __init__(
+        self,
+        coordinator: WeWashDataUpdateCoordinator,
+        room_id: Any,
+        kind: str,
+        legacy_key: str | None = None,
+    ) -> None:
+        """Initialize the expected wait sensor."""
+        key, name = room_key_name(coordinator, room_id, legacy_key)
+        type_name = APPLIANCE_TYPES[kind]["name"]
+        super().__init__(
+            coordinator,
+            f"{key}_{kind}_wait",
+            f"{name} {type_name} Wait",
+            APPLIANCE_TYPES[kind]["icon"],
+            room_device_info(coordinator, room_id),
+            legacy_entity_id=legacy_key is not None,
+            channels=frozenset(
+                {room_channel(room_id), room_reservations_channel(room_id)}
+            ),
+        )
+        self._room_id = room_id
+        self._kind = kind
+
+    def _deadline(self) -> datetime | None:
+        """Return the predicted end of the first own cycle."""
+        finish = self.coordinator.cycles.next_finish(self._room_id, self._kind)
+        return dt_util.utc_from_timestamp(finish / 1000) if finish is not None else None
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the expected wait in whole minutes."""
+        wait = self.coordinator.cycles.expected_wait(
+            self.coordinator.index, self._room_id, self._kind, time.time() * 1000
+        )
+        return int(wait / self._unit.total_seconds()) if wait is not None else None
+
+
+def room_entities(
+    coordinator: WeWashDataUpdateCoordinator,
+    room_id: Any,
+    legacy_key: str | None = None,
+) -> list[WeWashBaseSensor]:
+    """Return the entities describing one laundry room."""
+    return [
+        WeWashLaundryRoomSensor(coordinator, room_id, legacy_key),
+        WeWashExpectedWaitSensor(coordinator, room_id, APPLIANCE_WASHER, legacy_key),
+        WeWashExpectedWaitSensor(coordinator, room_id, APPLIANCE_DRYER, legacy_key),
+    ]
+
+
+def appliance_entities(
+    coordinator: WeWashDataUpdateCoordinator,
+    room_id: Any,
+    short_name: str,
+    kind: str,
+    legacy_key: str | None = None,
+) -> list[WeWashBaseSensor]:
+    """Return the entities describing one appliance."""
+    return [
+        entity_class(coordinator, room_id, short_name, kind, legacy_key)
+        for entity_class in (
+            WeWashApplianceSensor,
+            WeWashReservationTimeoutSensor,
+            WeWashReservationRemainingSensor,
+            WeWashPredictedFinishSensor,
+        )
+    ]
+
+
+class WeWashPerformanceSensor(WeWashBaseSensor):
+    """Base class for diagnostic performance sensors."""
+
+    _data_sections: frozenset[str] = frozenset()
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: WeWashDataUpdateCoordinator, key: str, name: str) -> None:
+        """Initialize the performance sensor."""
+        super().__init__(coordinator, key, name, ICON_PERFORMANCE, legacy_entity_id=False)
+
+
+class WeWashRefreshDurationSensor(WeWashPerformanceSensor):
+    """Duration of the last refresh cycle."""
+
+    def __init__(self, coordinator: WeWashDataUpdateCoordinator) -> None:
+        """Initialize the refresh duration sensor."""
+        super().__init__(coordinator, "refresh_duration", "Refresh Duration")
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the duration of the last refresh."""
+        return self.coordinator.api.stats.cycles.last
+
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the entity specific state attributes."""
+        cycles = self.coordinator.api.stats.cycles
+        return {
+            "p50": cycles.percentile(0.5),
+            "p95": cycles.percentile(0.95),
+            "p99": cycles.percentile(0.99),
+        }
+
+
+class WeWashEndpointLatencySensor(WeWashPerformanceSensor):
+    """Latency of one We-Wash endpoint."""
+
+    def __init__(self, coordinator: WeWashDataUpdateCoordinator, section: str) -> None:
+        """Initialize the endpoint latency sensor."""
+        super().__init__(
+            coordinator,
+            f"latency_{section}",
+            f"Latency {section.replace('_', ' ').title()}",
+        )
+        self._path = ENDPOINTS[section]
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the latency of the last request."""
+        return self.coordinator.api.stats.endpoint(self._path).latency.last
+
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the entity specific state attributes."""
+        stats = self.coordinator.api.stats.endpoint(self._path)
+        return {
+            "p50": stats.latency.percentile(0.5),
+            "p95": stats.latency.percentile(0.95),
+            "requests": stats.requests,
+            "timeouts": stats.timeouts,
+            "errors": stats.errors,
+            "last_response_bytes": stats.last_response_bytes,
+        }
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -304,13 +774,44 @@ async def async_setup_entry(
 ) -> None:
     """Set up We-Wash sensors."""
     coordinator: WeWashDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    first_room_id = coordinator.index.first_room_id
     
-    # Create the 4 entities as defined in entities.md
+    # The entities defined in entities.md keep their original ids and
+    # describe W1/T1 of the first laundry room
     entities = [
-        WeWashWasherSensor(coordinator),
-        WeWashDryerSensor(coordinator),
-        WeWashLaundryRoomSensor(coordinator),
         WeWashNextInvoiceSensor(coordinator),
+        WeWashInvoiceDueDateSensor(coordinator),
+        WeWashInvoiceDueInDaysSensor(coordinator),
+        *appliance_entities(coordinator, first_room_id, "W1", APPLIANCE_WASHER, "washer_w1"),
+        *appliance_entities(coordinator, first_room_id, "T1", APPLIANCE_DRYER, "dryer_t1"),
+        *room_entities(coordinator, first_room_id, "laundry_room"),
+        WeWashRefreshDurationSensor(coordinator),
+        *(WeWashEndpointLatencySensor(coordinator, section) for section in ENDPOINTS),
     ]
-    
     async_add_entities(entities)
+
+    known_rooms: set[Any] = {first_room_id}
+    known_appliances: set[ApplianceKey] = {(first_room_id, "W1"), (first_room_id, "T1")}
+
+    @callback
+    def _async_add_new_entities() -> None:
+        """Add entities for rooms and appliances seen for the first time."""
+        index = coordinator.index
+        new_entities: list[WeWashBaseSensor] = []
+
+        for room_id in index.rooms.keys() - known_rooms:
+            known_rooms.add(room_id)
+            new_entities.extend(room_entities(coordinator, room_id))
+
+        for key in index.appliances.keys() - known_appliances:
+            known_appliances.add(key)
+            room_id, short_name = key
+            new_entities.extend(
+                appliance_entities(coordinator, room_id, short_name, index.appliances[key].kind)
+            )
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_add_new_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
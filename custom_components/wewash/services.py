@@ -0,0 +1,139 @@
+"""Services for the We-Wash integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    APPLIANCE_DRYER,
+    APPLIANCE_WASHER,
+    ATTR_APPLIANCE,
+    ATTR_APPLIANCE_TYPE,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_LAUNDRY_ROOM_ID,
+    CAPTURE_DURATION,
+    DOMAIN,
+    SERVICE_CANCEL_RESERVATION,
+    SERVICE_CAPTURE_TRAFFIC,
+    SERVICE_CREATE_RESERVATION,
+    SERVICE_PROFILE_REFRESH,
+)
+from .coordinator import WeWashDataUpdateCoordinator
+
+PROFILE_REFRESH_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+CAPTURE_TRAFFIC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=CAPTURE_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=1440)
+        ),
+    }
+)
+CREATE_RESERVATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LAUNDRY_ROOM_ID): cv.string,
+        vol.Required(ATTR_APPLIANCE_TYPE): vol.In([APPLIANCE_WASHER, APPLIANCE_DRYER]),
+    }
+)
+CANCEL_RESERVATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_LAUNDRY_ROOM_ID): cv.string,
+        vol.Required(ATTR_APPLIANCE): vol.All(cv.string, vol.Upper),
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant, call: ServiceCall) -> list[WeWashDataUpdateCoordinator]:
+    """Return the coordinators a service call targets."""
+    coordinators: dict[str, WeWashDataUpdateCoordinator] = {
+        entry_id: coordinator
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if isinstance(coordinator, WeWashDataUpdateCoordinator)
+    }
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        raise HomeAssistantError(f"No loaded We-Wash entry {entry_id}")
+    return [coordinators[entry_id]]
+
+
+def _coordinator(hass: HomeAssistant, call: ServiceCall) -> WeWashDataUpdateCoordinator:
+    """Return the single coordinator an action targets."""
+    coordinators = _coordinators(hass, call)
+    if len(coordinators) != 1:
+        raise HomeAssistantError(
+            "Select the We-Wash entry, more than one is loaded"
+            if coordinators
+            else "No We-Wash entry is loaded"
+        )
+    return coordinators[0]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the We-Wash services."""
+
+    async def async_profile_refresh(call: ServiceCall) -> None:
+        """Profile one refresh cycle of the targeted entries."""
+        for coordinator in _coordinators(hass, call):
+            path = hass.config.path(
+                f"{DOMAIN}_profile_{coordinator.entry.entry_id}_{int(time.time())}.cprof"
+            )
+            await coordinator.async_profile_refresh(path)
+
+    async def async_capture_traffic(call: ServiceCall) -> None:
+        """Capture the API traffic of the targeted entries."""
+        minutes = call.data[ATTR_DURATION]
+        for coordinator in _coordinators(hass, call):
+            if not minutes:
+                coordinator.async_stop_capture()
+                continue
+            path = hass.config.path(
+                f"{DOMAIN}_capture_{coordinator.entry.entry_id}_{int(time.time())}.jsonl.gz"
+            )
+            coordinator.async_start_capture(path, timedelta(minutes=minutes))
+
+    async def async_create_reservation(call: ServiceCall) -> None:
+        """Reserve a washer or dryer."""
+        await _coordinator(hass, call).async_create_reservation(
+            call.data.get(ATTR_LAUNDRY_ROOM_ID), call.data[ATTR_APPLIANCE_TYPE]
+        )
+
+    async def async_cancel_reservation(call: ServiceCall) -> None:
+        """Cancel the reservation of an appliance."""
+        await _coordinator(hass, call).async_cancel_reservation(
+            call.data.get(ATTR_LAUNDRY_ROOM_ID), call.data[ATTR_APPLIANCE]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CAPTURE_TRAFFIC,
+        async_capture_traffic,
+        schema=CAPTURE_TRAFFIC_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CREATE_RESERVATION,
+        async_create_reservation,
+        schema=CREATE_RESERVATION_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_RESERVATION,
+        async_cancel_reservation,
+        schema=CANCEL_RESERVATION_SCHEMA,
+    )
@@ -0,0 +1,130 @@
+"""Performance counters for the We-Wash integration."""
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import LATENCY_BUCKETS, STATS_SAMPLES
+
+
+def _percentile(samples: deque[float], share: float) -> float | None:
+    """Return a percentile of the recent samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+@dataclass
+class LatencyHistogram:
+    """Latency histogram with fixed buckets (milliseconds)."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=STATS_SAMPLES))
+    last: float | None = None
+
+    def record(self, milliseconds: float) -> None:
+        """Add a sample."""
+        self.last = milliseconds
+        self.recent.append(milliseconds)
+        for position, bound in enumerate(LATENCY_BUCKETS):
+            if milliseconds <= bound:
+                self.buckets[position] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, share: float) -> float | None:
+        """Return a percentile of the recent samples."""
+        return _percentile(self.recent, share)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        return {
+            "last_ms": self.last,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "histogram_ms": dict(zip(labels, self.buckets)),
+        }
+
+
+@dataclass
+class EndpointStats:
+    """Counters of one endpoint."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    decode: LatencyHistogram = field(default_factory=LatencyHistogram)
+    status_codes: Counter[int] = field(default_factory=Counter)
+    requests: int = 0
+    response_bytes: int = 0
+    last_response_bytes: int | None = None
+    timeouts: int = 0
+    errors: int = 0
+    retries: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "response_bytes": self.response_bytes,
+            "last_response_bytes": self.last_response_bytes,
+            "status_codes": dict(self.status_codes),
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "retries": self.retries,
+            "decode_last_ms": self.decode.last,
+            "decode_p95_ms": self.decode.percentile(0.95),
+            **self.latency.as_dict(),
+        }
+
+
+@dataclass
+class WeWashStats:
+    """Performance counters of one config entry."""
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    cycles: LatencyHistogram = field(default_factory=LatencyHistogram)
+    token_refreshes: int = 0
+    logins: int = 0
+
+    def endpoint(self, name: str) -> EndpointStats:
+        """Return the counters of an endpoint."""
+        if (stats := self.endpoints.get(name)) is None:
+            stats = self.endpoints[name] = EndpointStats()
+        return stats
+
+    def record_response(
+        self, name: str, status: int, milliseconds: float, size: int
+    ) -> None:
+        """Record a completed request."""
+        stats = self.endpoint(name)
+        stats.requests += 1
+        stats.status_codes[status] += 1
+        stats.latency.record(milliseconds)
+        stats.response_bytes += size
+        stats.last_response_bytes = size
+
+    def record_timeout(self, name: str) -> None:
+        """Record a request that timed out."""
+        stats = self.endpoint(name)
+        stats.requests += 1
+        stats.timeouts += 1
+
+    def record_error(self, name: str) -> None:
+        """Record a request that failed without a response."""
+        stats = self.endpoint(name)
+        stats.requests += 1
+        stats.errors += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters for diagnostics."""
+        return {
+            "cycles": self.cycles.as_dict(),
+            "token_refreshes": self.token_refreshes,
+            "logins": self.logins,
+            "endpoints": {
+                name: stats.as_dict() for name, stats in self.endpoints.items()
+            },
+        }